@@ -22,6 +22,7 @@ WHY ID-BASED WORKS:
 """
 
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
@@ -138,10 +139,23 @@ class FindTracker:
         self.log = logger.get_logger('find_tracker') if hasattr(logger, 'get_logger') else logger
         self.data_dir = data_dir or Path('/config')
         
-        # Finds history
+        # The search cycle and the per-service queue monitors run on separate
+        # scheduler workers; every read-modify-write of the state below (and
+        # the snapshot in _save) happens under this lock
+        self._lock = threading.RLock()
+        
+        # Finds history - append via _add_find so the breakdowns stay in step
         self.finds: List[Find] = []
         self.max_finds_history = 1000
         
+        # Breakdowns over self.finds, maintained on append/trim so get_stats
+        # doesn't rescan the history on every dashboard poll
+        self._by_tier = {'hot': 0, 'warm': 0, 'cool': 0, 'cold': 0}
+        self._by_type = {'missing': 0, 'upgrade': 0}
+        self._by_source = {'sonarr': 0, 'radarr': 0}
+        self._tfm_seconds_sum = 0
+        self._tfm_count = 0
+        
         # Tracked searches - items TFM has searched for
         # Key: "source:instance:item_id" -> TrackedSearch
         self.tracked_searches: Dict[str, TrackedSearch] = {}
@@ -175,9 +189,9 @@ class FindTracker:
                 # Load finds
                 for find_data in data.get('finds', [])[-self.max_finds_history:]:
                     try:
-                        self.finds.append(Find.from_dict(find_data))
+                        self._add_find(Find.from_dict(find_data))
                     except Exception as e:
-                        self.log.debug(f"Could not load find: {e}")
+                        self.log.debug("Could not load find: %s", e)
                 
                 # Load counters
                 self.finds_total = data.get('finds_total', len(self.finds))
@@ -188,7 +202,7 @@ class FindTracker:
                     try:
                         self.tracked_searches[key] = TrackedSearch.from_dict(search_data)
                     except Exception as e:
-                        self.log.debug(f"Could not load tracked search: {e}")
+                        self.log.debug("Could not load tracked search: %s", e)
                 
                 # Load pending finds
                 self.pending_finds = data.get('pending_finds', {})
@@ -213,21 +227,22 @@ class FindTracker:
     
     def _save(self):
         """Save finds to disk."""
-        try:
-            path = self._get_finds_path()
-            data = {
-                'finds': [f.to_dict() for f in self.finds[-self.max_finds_history:]],
-                'finds_total': self.finds_total,
-                'finds_today': self.finds_today,
-                'last_reset_date': self.last_reset_date.isoformat(),
-                'tracked_searches': {k: v.to_dict() for k, v in self.tracked_searches.items()},
-                'pending_finds': self.pending_finds,
-                'credited_items': list(self.credited_items)[-5000:],  # Limit size
-            }
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            self.log.error(f"Could not save finds: {e}")
+        with self._lock:
+            try:
+                path = self._get_finds_path()
+                data = {
+                    'finds': [f.to_dict() for f in self.finds[-self.max_finds_history:]],
+                    'finds_total': self.finds_total,
+                    'finds_today': self.finds_today,
+                    'last_reset_date': self.last_reset_date.isoformat(),
+                    'tracked_searches': {k: v.to_dict() for k, v in self.tracked_searches.items()},
+                    'pending_finds': self.pending_finds,
+                    'credited_items': list(self.credited_items)[-5000:],  # Limit size
+                }
+                with open(path, 'w') as f:
+                    json.dump(data, f, indent=2)
+            except Exception as e:
+                self.log.error(f"Could not save finds: {e}")
     
     def _reset_daily_counters(self):
         """Reset daily counters if it's a new day."""
@@ -246,22 +261,23 @@ class FindTracker:
         Call this BEFORE triggering the search in Sonarr/Radarr.
         Returns the tracking key.
         """
-        key = f"{source}:{instance_name}:{item_id}"
-        
-        self.tracked_searches[key] = TrackedSearch(
-            source=source,
-            instance_name=instance_name,
-            item_id=item_id,
-            series_id=series_id,
-            title=title,
-            tier=tier,
-            search_type=search_type,
-            searched_at=datetime.utcnow(),
-        )
-        
-        self.log.info(f"🔎 Tracking search: {title} ({key})")
-        self._save()
-        return key
+        with self._lock:
+            key = f"{source}:{instance_name}:{item_id}"
+
+            self.tracked_searches[key] = TrackedSearch(
+                source=source,
+                instance_name=instance_name,
+                item_id=item_id,
+                series_id=series_id,
+                title=title,
+                tier=tier,
+                search_type=search_type,
+                searched_at=datetime.utcnow(),
+            )
+
+            self.log.info(f"🔎 Tracking search: {title} ({key})")
+            self._save()
+            return key
     
     def check_queue_for_finds(self, queue_items: List[Dict], source: str,
                               instance_name: str, client=None) -> List[Find]:
@@ -271,81 +287,82 @@ class FindTracker:
         Items that match become "pending finds" - they'll be confirmed
         when the file actually imports (hasFile=true).
         """
-        self._reset_daily_counters()
-        now = datetime.utcnow()
-        
-        for item in queue_items:
-            # Get the item ID
-            if source == 'sonarr':
-                item_id = item.get('episodeId')
-                series_id = item.get('seriesId')
-            elif source == 'radarr':
-                item_id = item.get('movieId')
-                series_id = None
-            else:
-                continue
-            
-            if not item_id:
-                continue
-            
-            key = f"{source}:{instance_name}:{item_id}"
-            
-            # Skip if already credited or already pending
-            if key in self.credited_items or key in self.pending_finds:
-                continue
-            
-            # Check if this matches a tracked search
-            tracked = self.tracked_searches.get(key)
-            if not tracked:
-                continue
-            
-            # Check timing - must be within 2 hours of search
-            time_since_search = (now - tracked.searched_at).total_seconds()
-            if time_since_search > 7200:  # 2 hours
-                continue
-            
-            # Get title from queue item
-            title = tracked.title
-            if source == 'sonarr':
-                series_info = item.get('series', {})
-                episode_info = item.get('episode', {})
-                if series_info and episode_info:
-                    series_title = series_info.get('title', '')
-                    season = episode_info.get('seasonNumber', 0)
-                    ep_num = episode_info.get('episodeNumber', 0)
-                    title = f"{series_title} - S{season:02d}E{ep_num:02d}"
-            elif source == 'radarr':
-                movie_info = item.get('movie', {})
-                if movie_info:
-                    title = movie_info.get('title', '')
-                    year = movie_info.get('year', '')
-                    if year:
-                        title = f"{title} ({year})"
-            
-            # Get quality/indexer info
-            quality = item.get('quality', {}).get('quality', {}).get('name', '')
-            indexer = item.get('indexer', '')
-            
-            # Track as PENDING find
-            self.pending_finds[key] = {
-                'title': title,
-                'source': source,
-                'instance_name': instance_name,
-                'item_id': item_id,
-                'series_id': series_id,
-                'tier': tracked.tier,
-                'search_type': tracked.search_type,
-                'searched_at': tracked.searched_at.isoformat(),
-                'grabbed_at': now.isoformat(),
-                'search_to_find_seconds': int(time_since_search),
-                'indexer': indexer,
-                'quality': quality,
-            }
-            
-            self.log.info(f"📥 GRABBED: {title} (tracked by TFM, pending verification)")
-        
-        self._save()
-        return []  # Real finds returned by verify_completed_finds
+        with self._lock:
+            self._reset_daily_counters()
+            now = datetime.utcnow()
+
+            for item in queue_items:
+                # Get the item ID
+                if source == 'sonarr':
+                    item_id = item.get('episodeId')
+                    series_id = item.get('seriesId')
+                elif source == 'radarr':
+                    item_id = item.get('movieId')
+                    series_id = None
+                else:
+                    continue
+
+                if not item_id:
+                    continue
+
+                key = f"{source}:{instance_name}:{item_id}"
+
+                # Skip if already credited or already pending
+                if key in self.credited_items or key in self.pending_finds:
+                    continue
+
+                # Check if this matches a tracked search
+                tracked = self.tracked_searches.get(key)
+                if not tracked:
+                    continue
+
+                # Check timing - must be within 2 hours of search
+                time_since_search = (now - tracked.searched_at).total_seconds()
+                if time_since_search > 7200:  # 2 hours
+                    continue
+
+                # Get title from queue item
+                title = tracked.title
+                if source == 'sonarr':
+                    series_info = item.get('series', {})
+                    episode_info = item.get('episode', {})
+                    if series_info and episode_info:
+                        series_title = series_info.get('title', '')
+                        season = episode_info.get('seasonNumber', 0)
+                        ep_num = episode_info.get('episodeNumber', 0)
+                        title = f"{series_title} - S{season:02d}E{ep_num:02d}"
+                elif source == 'radarr':
+                    movie_info = item.get('movie', {})
+                    if movie_info:
+                        title = movie_info.get('title', '')
+                        year = movie_info.get('year', '')
+                        if year:
+                            title = f"{title} ({year})"
+
+                # Get quality/indexer info
+                quality = item.get('quality', {}).get('quality', {}).get('name', '')
+                indexer = item.get('indexer', '')
+
+                # Track as PENDING find
+                self.pending_finds[key] = {
+                    'title': title,
+                    'source': source,
+                    'instance_name': instance_name,
+                    'item_id': item_id,
+                    'series_id': series_id,
+                    'tier': tracked.tier,
+                    'search_type': tracked.search_type,
+                    'searched_at': tracked.searched_at.isoformat(),
+                    'grabbed_at': now.isoformat(),
+                    'search_to_find_seconds': int(time_since_search),
+                    'indexer': indexer,
+                    'quality': quality,
+                }
+
+                self.log.info(f"📥 GRABBED: {title} (tracked by TFM, pending verification)")
+
+            self._save()
+            return []  # Real finds returned by verify_completed_finds
     
     def verify_completed_finds(self, source: str, instance_name: str, client) -> List[Find]:
         """
@@ -353,28 +370,40 @@ class FindTracker:
         
         Only confirms finds when hasFile=true on the episode/movie.
         """
-        self._reset_daily_counters()
-        confirmed_finds = []
-        now = datetime.utcnow()
+        # Snapshot this instance's pending finds (dropping expired ones) under
+        # the lock, but make the hasFile lookups without it - a slow *arr must
+        # not hold up record_find, get_stats or the other service's monitor
+        with self._lock:
+            self._reset_daily_counters()
+            now = datetime.utcnow()
+            prefix = f"{source}:{instance_name}:"
+            expired = []
+            candidates = []
+            for key, pending in self.pending_finds.items():
+                # Only check items from this source/instance
+                if not key.startswith(prefix):
+                    continue
+
+                # Skip if too old (give up after 24 hours)
+                grabbed_at_str = pending.get('grabbed_at')
+                if grabbed_at_str:
+                    try:
+                        grabbed_at = datetime.fromisoformat(grabbed_at_str)
+                        if (now - grabbed_at).total_seconds() > 86400:
+                            self.log.debug("Pending find expired: %s", pending['title'])
+                            expired.append(key)
+                            continue
+                    except (TypeError, ValueError):
+                        pass
+
+                candidates.append((key, dict(pending)))
+
+            for key in expired:
+                self.pending_finds.pop(key, None)
+                self.tracked_searches.pop(key, None)
         
-        to_remove = []
-        for key, pending in list(self.pending_finds.items()):
-            # Only check items from this source/instance
-            if not key.startswith(f"{source}:{instance_name}:"):
-                continue
-            
-            # Skip if too old (give up after 24 hours)
-            grabbed_at_str = pending.get('grabbed_at')
-            if grabbed_at_str:
-                try:
-                    grabbed_at = datetime.fromisoformat(grabbed_at_str)
-                    if (now - grabbed_at).total_seconds() > 86400:
-                        self.log.debug(f"Pending find expired: {pending['title']}")
-                        to_remove.append(key)
-                        continue
-                except:
-                    pass
-            
+        imported = []
+        for key, pending in candidates:
             try:
                 has_file = False
                 item_id = pending.get('item_id')
@@ -382,151 +411,159 @@ class FindTracker:
                 if source == 'sonarr' and item_id:
                     episode = client.get_episode(item_id)
                     has_file = episode.get('hasFile', False) if episode else False
-                    
+                
                 elif source == 'radarr' and item_id:
                     movie = client.get_movie(item_id)
                     has_file = movie.get('hasFile', False) if movie else False
                 
                 if has_file:
-                    # CONFIRMED FIND! 🎉
                     searched_at = datetime.fromisoformat(pending['searched_at'])
-                    
-                    find = Find(
-                        title=pending['title'],
-                        source=source,
-                        instance_name=instance_name,
-                        item_id=item_id,
-                        series_id=pending.get('series_id'),
-                        movie_id=item_id if source == 'radarr' else None,
-                        tier=pending['tier'],
-                        resolution_type='tfm_search',
-                        search_type=pending['search_type'],
-                        found_at=now,
-                        searched_at=searched_at,
-                        search_to_find_seconds=pending.get('search_to_find_seconds', 0),
-                        indexer=pending.get('indexer', ''),
-                        quality=pending.get('quality', ''),
-                    )
-                    
-                    self.finds.append(find)
-                    self.finds_today += 1
-                    self.finds_total += 1
-                    self.credited_items.add(key)
-                    confirmed_finds.append(find)
-                    to_remove.append(key)
-                    
-                    self.log.info(f"🎉 TFM FIND CONFIRMED: {pending['title']} "
-                                f"({pending['tier']} tier, file imported!)")
-                    
+                    imported.append((key, pending, searched_at))
             except Exception as e:
-                self.log.debug(f"Could not verify {pending.get('title', key)}: {e}")
-        
-        # Remove processed items
-        for key in to_remove:
-            self.pending_finds.pop(key, None)
-            self.tracked_searches.pop(key, None)
-        
-        if confirmed_finds or to_remove:
-            if len(self.finds) > self.max_finds_history:
-                self.finds = self.finds[-self.max_finds_history:]
-            self._save()
+                self.log.debug("Could not verify %s: %s", pending.get('title', key), e)
         
-        return confirmed_finds
+        with self._lock:
+            confirmed_finds = []
+            now = datetime.utcnow()
+            for key, pending, searched_at in imported:
+                # Credited or dropped by another caller while we were checking
+                if key not in self.pending_finds or key in self.credited_items:
+                    continue
+
+                # CONFIRMED FIND! 🎉
+                item_id = pending.get('item_id')
+                find = Find(
+                    title=pending['title'],
+                    source=source,
+                    instance_name=instance_name,
+                    item_id=item_id,
+                    series_id=pending.get('series_id'),
+                    movie_id=item_id if source == 'radarr' else None,
+                    tier=pending['tier'],
+                    resolution_type='tfm_search',
+                    search_type=pending['search_type'],
+                    found_at=now,
+                    searched_at=searched_at,
+                    search_to_find_seconds=pending.get('search_to_find_seconds', 0),
+                    indexer=pending.get('indexer', ''),
+                    quality=pending.get('quality', ''),
+                )
+
+                self._add_find(find)
+                self.finds_today += 1
+                self.finds_total += 1
+                self.credited_items.add(key)
+                confirmed_finds.append(find)
+                self.pending_finds.pop(key, None)
+                self.tracked_searches.pop(key, None)
+
+                self.log.info("🎉 TFM FIND CONFIRMED: %s (%s tier, file imported!)",
+                              pending['title'], pending['tier'])
+
+            if confirmed_finds or expired:
+                self._save()
+
+            return confirmed_finds
     
     def cleanup_old_searches(self, max_age_hours: int = 2):
         """Remove tracked searches older than max_age_hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-        to_remove = []
-        
-        for key, search in self.tracked_searches.items():
-            if search.searched_at < cutoff:
-                to_remove.append(key)
-        
-        for key in to_remove:
-            del self.tracked_searches[key]
-        
-        if to_remove:
-            self.log.debug(f"Cleaned up {len(to_remove)} old tracked searches")
-            self._save()
+        with self._lock:
+            cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+            to_remove = []
+
+            for key, search in self.tracked_searches.items():
+                if search.searched_at < cutoff:
+                    to_remove.append(key)
+
+            for key in to_remove:
+                del self.tracked_searches[key]
+
+            if to_remove:
+                self.log.debug("Cleaned up %s old tracked searches", len(to_remove))
+                self._save()
     
     def record_manual_find(self, title: str, source: str, instance_name: str,
                           item_id: int, tier: str, search_type: str,
                           resolution_type: str = 'auto_resolve',
                           series_id: int = None, movie_id: int = None):
         """Record a find from auto-resolution or manual action."""
-        self._reset_daily_counters()
-        
-        key = f"{source}:{instance_name}:{item_id}"
-        if key in self.credited_items:
-            return
-        
-        now = datetime.utcnow()
-        find = Find(
-            title=title,
-            source=source,
-            instance_name=instance_name,
-            item_id=item_id,
-            series_id=series_id,
-            movie_id=movie_id,
-            tier=tier,
-            resolution_type=resolution_type,
-            search_type=search_type,
-            found_at=now,
-            searched_at=now,
-            search_to_find_seconds=0,
-        )
-        
-        self.finds.append(find)
-        self.finds_today += 1
-        self.finds_total += 1
-        self.credited_items.add(key)
-        
-        if len(self.finds) > self.max_finds_history:
-            self.finds = self.finds[-self.max_finds_history:]
-        
-        self._save()
-        self.log.info(f"📝 Manual find recorded: {title} ({resolution_type})")
+        with self._lock:
+            self._reset_daily_counters()
+
+            key = f"{source}:{instance_name}:{item_id}"
+            if key in self.credited_items:
+                return
+
+            now = datetime.utcnow()
+            find = Find(
+                title=title,
+                source=source,
+                instance_name=instance_name,
+                item_id=item_id,
+                series_id=series_id,
+                movie_id=movie_id,
+                tier=tier,
+                resolution_type=resolution_type,
+                search_type=search_type,
+                found_at=now,
+                searched_at=now,
+                search_to_find_seconds=0,
+            )
+
+            self._add_find(find)
+            self.finds_today += 1
+            self.finds_total += 1
+            self.credited_items.add(key)
+
+            self._save()
+            self.log.info(f"📝 Manual find recorded: {title} ({resolution_type})")
     
     def get_recent_finds(self, limit: int = 50) -> List[Dict]:
         """Get recent finds for display."""
         return [f.to_dict() for f in self.finds[-limit:]][::-1]
     
+    def _add_find(self, find: Find):
+        """Append to the history, trimming to max_finds_history and updating breakdowns."""
+        self.finds.append(find)
+        self._count_find(find, 1)
+        excess = len(self.finds) - self.max_finds_history
+        if excess > 0:
+            for old in self.finds[:excess]:
+                self._count_find(old, -1)
+            del self.finds[:excess]
+    
+    def _count_find(self, find: Find, delta: int):
+        """Add (delta=1) or remove (delta=-1) one find from the breakdowns."""
+        for counts, value in ((self._by_tier, find.tier),
+                              (self._by_type, find.search_type),
+                              (self._by_source, find.source)):
+            value = value.lower()
+            if value in counts:
+                counts[value] += delta
+        if find.resolution_type == 'tfm_search' and find.search_to_find_seconds > 0:
+            self._tfm_seconds_sum += delta * find.search_to_find_seconds
+            self._tfm_count += delta
+    
     def get_finds_by_tier(self) -> Dict[str, int]:
         """Get find counts by tier."""
-        counts = {'hot': 0, 'warm': 0, 'cool': 0, 'cold': 0}
-        for find in self.finds:
-            tier = find.tier.lower()
-            if tier in counts:
-                counts[tier] += 1
-        return counts
+        return dict(self._by_tier)
     
     def get_finds_by_type(self) -> Dict[str, int]:
         """Get find counts by type (missing vs upgrade)."""
-        counts = {'missing': 0, 'upgrade': 0}
-        for find in self.finds:
-            search_type = find.search_type.lower()
-            if search_type in counts:
-                counts[search_type] += 1
-        return counts
+        return dict(self._by_type)
     
     def get_finds_by_source(self) -> Dict[str, int]:
         """Get find counts by source (sonarr vs radarr)."""
-        counts = {'sonarr': 0, 'radarr': 0}
-        for find in self.finds:
-            source = find.source.lower()
-            if source in counts:
-                counts[source] += 1
-        return counts
+        return dict(self._by_source)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get find statistics."""
         self._reset_daily_counters()
         
-        # Calculate average time to find
-        tfm_finds = [f for f in self.finds if f.resolution_type == 'tfm_search' and f.search_to_find_seconds > 0]
+        # Average time to find, over TFM-search finds with a recorded duration
         avg_time = 0
-        if tfm_finds:
-            avg_time = sum(f.search_to_find_seconds for f in tfm_finds) / len(tfm_finds)
+        if self._tfm_count:
+            avg_time = self._tfm_seconds_sum / self._tfm_count
         
         return {
             'finds_today': self.finds_today,
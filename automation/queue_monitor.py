@@ -269,6 +269,44 @@ class QueueMonitor:
         
         return False
     
+    def resolve_stuck_items(self, stuck_items: List[StuckItem], client) -> int:
+        """
+        Resolve several stuck items from one instance with a bulk delete per action.
+        
+        Returns the number of items resolved.
+        """
+        by_action: Dict[str, List[StuckItem]] = {}
+        for stuck in stuck_items:
+            if stuck.auto_resolve_action in ('blocklist_retry', 'remove'):
+                by_action.setdefault(stuck.auto_resolve_action, []).append(stuck)
+        
+        resolved = 0
+        for action, items in by_action.items():
+            if len(items) == 1:
+                resolved += self.resolve_stuck_item(items[0], client)
+                continue
+            
+            self.log.info("Auto-resolving %d queue items (%s)", len(items), action)
+            blocklist = action == 'blocklist_retry'
+            success = client.delete_queue_items_bulk(
+                [s.queue_id for s in items],
+                blocklist=blocklist,
+                remove_from_client=True,
+                skip_redownload=not blocklist
+            )
+            if not success:
+                # One bad id (e.g. already gone) fails the whole bulk call -
+                # fall back to per-item deletes, which treat a 404 as resolved
+                self.log.info("Bulk queue delete failed - resolving %d items one at a time", len(items))
+                resolved += sum(self.resolve_stuck_item(stuck, client) for stuck in items)
+                continue
+            for stuck in items:
+                self.stuck_items.pop(f"{stuck.source}:{stuck.queue_id}", None)
+            self.resolved_count += len(items)
+            resolved += len(items)
+        
+        return resolved
+    
     def create_intervention(self, item_id: int, title: str, source: str,
                            instance_name: str, intervention_type: str,
                            reason: str, details: Dict = None,
@@ -382,6 +420,29 @@ class QueueMonitor:
                 ]
             )
     
+    def get_release_instance(self, source: str, guid: str) -> Optional[str]:
+        """Instance whose release_available intervention offered this release."""
+        if not guid:
+            return None
+        for intervention in list(self.interventions.values()):
+            if (intervention.source == source
+                    and intervention.intervention_type == 'release_available'
+                    and any(r.get('guid') == guid
+                            for r in intervention.details.get('releases', []))):
+                return intervention.instance_name
+        return None
+    
+    def get_intervention_instance(self, source: str, item_id: int,
+                                  intervention_type: str = None) -> Optional[str]:
+        """Instance an intervention for this item was raised on, if any."""
+        if intervention_type:
+            intervention = self.interventions.get(f"{source}:{item_id}:{intervention_type}")
+            return intervention.instance_name if intervention else None
+        for intervention in list(self.interventions.values()):
+            if intervention.source == source and intervention.id == item_id:
+                return intervention.instance_name
+        return None
+    
     def cleanup_resolved_items(self, current_queue_ids: Dict[str, set]):
         """
         Remove stuck items and interventions that are no longer in the queue.
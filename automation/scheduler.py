@@ -1,12 +1,22 @@
 """
 Scheduler for The Fantastic Machinarr.
 Manages periodic tasks for searching, queue monitoring, and notifications.
+
+Tasks can name the resource they mostly wait on (e.g. one service's HTTP API).
+Each resource gets its own worker thread, so a slow sweep of one service
+doesn't hold up tasks on another; tasks sharing a resource run one after
+another in priority order. Tasks without a resource run on the scheduler
+thread itself.
+
+Events (e.g. webhooks) can ask for a task to run early with request_run,
+which marks it due and wakes the scheduler instead of waiting for the
+next 30s tick.
 """
 
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional
 from dataclasses import dataclass
 
 
@@ -15,12 +25,15 @@ class ScheduledTask:
     """A scheduled task."""
     name: str
     func: Callable
-    interval_minutes: int
+    interval_minutes: float
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
     enabled: bool = True
     run_count: int = 0
     last_error: Optional[str] = None
+    resource: Optional[str] = None
+    priority: int = 0  # Higher runs first among due tasks on the same resource
+    run_pending: bool = False  # request_run arrived; run again right after the current run
     
     def should_run(self) -> bool:
         if not self.enabled:
@@ -30,7 +43,12 @@ class ScheduledTask:
         return datetime.utcnow() >= self.next_run
     
     def schedule_next(self):
-        self.next_run = datetime.utcnow() + timedelta(minutes=self.interval_minutes)
+        if self.run_pending:
+            # An event came in mid-run - its changes may have missed this pass
+            self.run_pending = False
+            self.next_run = datetime.utcnow()
+        else:
+            self.next_run = datetime.utcnow() + timedelta(minutes=self.interval_minutes)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -41,6 +59,8 @@ class ScheduledTask:
             'next_run': self.next_run.isoformat() if self.next_run else None,
             'run_count': self.run_count,
             'last_error': self.last_error,
+            'resource': self.resource,
+            'priority': self.priority,
         }
 
 
@@ -54,16 +74,38 @@ class Scheduler:
         self._running = False
         self._thread = None
         self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        # Guards run_pending/next_run between request_run and a finishing run
+        self._lock = threading.Lock()
+        self._workers: Dict[str, threading.Thread] = {}
+        # Bumped whenever any task's reported state changes, so
+        # get_task_dicts can reuse its last result between changes
+        self._version = 0
+        self._task_dicts = (-1, [])
     
     def register_task(self, name: str, func: Callable, 
-                      interval_minutes: int, enabled: bool = True):
-        """Register a task."""
+                      interval_minutes: float, enabled: bool = True,
+                      resource: Optional[str] = None, priority: int = 0):
+        """Register a task, optionally on its own resource worker."""
         task = ScheduledTask(name=name, func=func, 
-                            interval_minutes=interval_minutes, enabled=enabled)
+                            interval_minutes=interval_minutes, enabled=enabled,
+                            resource=resource, priority=priority)
         task.schedule_next()
         self.tasks[name] = task
+        self._version += 1
         self.log.info(f"Registered task: {name} (every {interval_minutes} min)")
     
+    def set_interval(self, name: str, interval_minutes: float):
+        """
+        Change a task's interval. Takes effect from its next scheduling, so a
+        task can call this on itself to adapt how often it runs.
+        """
+        task = self.tasks.get(name)
+        if task and task.interval_minutes != interval_minutes:
+            task.interval_minutes = interval_minutes
+            self._version += 1
+            self.log.debug("Task %s interval now %s min", name, interval_minutes)
+    
     def start(self):
         """Start the scheduler."""
         if self._running:
@@ -78,21 +120,58 @@ class Scheduler:
         """Stop the scheduler."""
         self._running = False
         self._stop_event.set()
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=5)
+        for worker in list(self._workers.values()):
+            worker.join(timeout=5)
     
     def _run_loop(self):
         """Main loop."""
         while self._running and not self._stop_event.is_set():
-            for task in self.tasks.values():
+            due: Dict[Optional[str], List[ScheduledTask]] = {}
+            for task in sorted(self.tasks.values(), key=lambda t: -t.priority):
                 if task.should_run():
+                    due.setdefault(task.resource, []).append(task)
+            
+            for resource, tasks in due.items():
+                if resource is None:
+                    for task in tasks:
+                        self._run_task(task)
+                else:
+                    self._dispatch(resource, tasks)
+            self._wake.wait(30)
+            self._wake.clear()
+    
+    def _dispatch(self, resource: str, tasks: List[ScheduledTask]):
+        """Run due tasks on the resource's worker, unless it's still busy."""
+        worker = self._workers.get(resource)
+        if worker and worker.is_alive():
+            # Still working through the last batch - pick these up next tick
+            return
+        
+        def run_batch():
+            batch = tasks
+            while batch and not self._stop_event.is_set():
+                for task in batch:
+                    if self._stop_event.is_set():
+                        break
                     self._run_task(task)
-            self._stop_event.wait(30)
+                # Runs requested mid-batch are due again already; take them
+                # here, since the loop skips this resource while we're alive
+                batch = [t for t in tasks if t.should_run()]
+        
+        worker = threading.Thread(target=run_batch, name=f'scheduler-{resource}', daemon=True)
+        self._workers[resource] = worker
+        worker.start()
     
     def _run_task(self, task: ScheduledTask):
         """Execute a task."""
+        with self._lock:
+            # This run covers any request made before it started
+            task.run_pending = False
         try:
-            self.log.debug(f"Running: {task.name}")
+            self.log.debug("Running: %s", task.name)
             task.func()
             task.last_run = datetime.utcnow()
             task.run_count += 1
@@ -101,7 +180,28 @@ class Scheduler:
             task.last_error = str(e)
             self.log.error(f"Task {task.name} failed: {e}")
         finally:
-            task.schedule_next()
+            with self._lock:
+                rerun = task.run_pending
+                task.schedule_next()
+            self._version += 1
+            if rerun:
+                self._wake.set()
+    
+    def request_run(self, name: str) -> bool:
+        """
+        Make a task due now and wake the scheduler loop. The task still runs
+        on its usual resource worker, so it never overlaps its own sweep; if it
+        is mid-run, it runs again as soon as that run finishes.
+        """
+        task = self.tasks.get(name)
+        if not task or not task.enabled:
+            return False
+        with self._lock:
+            task.run_pending = True
+            task.next_run = datetime.utcnow()
+        self._version += 1
+        self._wake.set()
+        return True
     
     def run_task_now(self, name: str) -> bool:
         """Run a task immediately."""
@@ -110,9 +210,18 @@ class Scheduler:
             return True
         return False
     
+    def get_task_dicts(self) -> List[Dict[str, Any]]:
+        """to_dict() of every task, rebuilt only after a change. Treat as read-only."""
+        version = self._version
+        cached_version, dicts = self._task_dicts
+        if cached_version != version:
+            dicts = [t.to_dict() for t in list(self.tasks.values())]
+            self._task_dicts = (version, dicts)
+        return dicts
+    
     def get_status(self) -> Dict[str, Any]:
         """Get status."""
         return {
             'running': self._running,
-            'tasks': {n: t.to_dict() for n, t in self.tasks.items()}
+            'tasks': {d['name']: d for d in self.get_task_dicts()}
         }
@@ -247,7 +247,7 @@ class SmartSearcher:
                         self.search_results.append(result)
                         migrated += 1
                     except Exception as e:
-                        self.log.debug(f"Could not migrate {key}: {e}")
+                        self.log.debug("Could not migrate %s: %s", key, e)
             
             if migrated > 0:
                 # Sort by timestamp
@@ -479,7 +479,7 @@ class SmartSearcher:
             return []
         
         preset = self._get_pacing_preset()
-        self.log.debug(f"Using pacing preset: {preset} (API limit: {self.config.search.daily_api_limit})")
+        self.log.debug("Using pacing preset: %s (API limit: %s)", preset, self.config.search.daily_api_limit)
         
         # Filter out items still in cooldown, track items needing intervention
         now = datetime.utcnow()
@@ -518,7 +518,7 @@ class SmartSearcher:
             eligible_items.append(item)
         
         if skipped_cooldown > 0:
-            self.log.debug(f"Skipped {skipped_cooldown} items still in cooldown")
+            self.log.debug("Skipped %s items still in cooldown", skipped_cooldown)
         
         # Flag items needing intervention
         if needs_intervention:
@@ -761,7 +761,7 @@ class SmartSearcher:
                         if item.get('episodeId'):
                             downloading_ids.add(f"sonarr:{name}:ep:{item.get('episodeId')}")
             except Exception as e:
-                self.log.debug(f"Could not check Sonarr ({name}) queue: {e}")
+                self.log.debug("Could not check Sonarr (%s) queue: %s", name, e)
         
         for name, client in radarr_clients.items():
             try:
@@ -771,7 +771,7 @@ class SmartSearcher:
                         if item.get('movieId'):
                             downloading_ids.add(f"radarr:{name}:movie:{item.get('movieId')}")
             except Exception as e:
-                self.log.debug(f"Could not check Radarr ({name}) queue: {e}")
+                self.log.debug("Could not check Radarr (%s) queue: %s", name, e)
         
         if downloading_ids:
             self.log.info(f"Found {len(downloading_ids)} items already downloading - will skip these")
@@ -4,9 +4,28 @@ Classifies items as Hot, Warm, Cool, or Cold based on age.
 """
 
 from enum import Enum
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from dataclasses import dataclass, field
+from bisect import bisect_left
+from functools import lru_cache
+import time
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an Arr ISO date ('...Z' or offset) into a naive UTC datetime.
+    
+    Cached because missing lists repeat the same air/release timestamps a
+    lot (whole seasons, daily shows); returns None for unparseable values.
+    """
+    try:
+        parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    # Strip timezone for comparison
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
 
 
 class Tier(Enum):
@@ -62,9 +81,24 @@ class TieredItem:
     last_searched: Optional[datetime] = None
     search_count: int = 0
     search_type: str = 'missing'  # 'missing' or 'upgrade'
+    # (search state, dict) from the last to_dict - see to_dict
+    _dict_cache: Optional[Tuple[tuple, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        """
+        Serialize for the API. Treat the result as read-only.
+        
+        Items are fixed once classified apart from their search fields, so the
+        dict is built once and reused until one of those changes - cached
+        missing results get rendered on every dashboard poll.
+        """
+        state = (self.search_type, self.last_searched, self.search_count)
+        cached = self._dict_cache
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        
+        result = {
             'id': self.id,
             'title': self.title,
             'source': self.source,
@@ -83,6 +117,8 @@ class TieredItem:
             'last_searched': self.last_searched.isoformat() if self.last_searched else None,
             'search_count': self.search_count,
         }
+        self._dict_cache = (state, result)
+        return result
     
     @property
     def formatted_code(self) -> str:
@@ -95,10 +131,18 @@ class TieredItem:
 class TierManager:
     """Manages tier classification and tracking."""
     
+    # How long classify_from_date_str reuses a date's tier; a boundary
+    # crossing shows up at most this late
+    DATE_TIER_MEMO_SECONDS = 60
+    DATE_TIER_MEMO_MAX = 50000
+    
     def __init__(self, config, history_path: str = "/config/search_history.json"):
         self.config = config
         self.history_path = history_path
         self.search_history: Dict[str, TieredItem] = {}  # key: "source:id"
+        # classify_from_date_str results: (monotonic start, {date_str: tier}),
+        # restarted every DATE_TIER_MEMO_SECONDS so tiers follow the clock
+        self._date_tier_memo: Tuple[float, Dict[str, str]] = (0.0, {})
         self._load_history()
     
     def _load_history(self):
@@ -152,25 +196,38 @@ class TierManager:
         except Exception as e:
             print(f"Could not save search history: {e}")
     
-    def classify(self, air_date: Optional[datetime]) -> Tier:
-        """Classify an item into a tier based on air date."""
+    def _tier_limits(self) -> Tuple[int, int, int]:
+        """Max age in days for Hot, Warm and Cool (config, with defaults)."""
+        tiers = self.config.tiers
+        return (tiers.hot.max_days or 90,
+                tiers.warm.max_days or 365,
+                tiers.cool.max_days or 1095)
+    
+    def classify(self, air_date: Optional[datetime], now: Optional[datetime] = None,
+                 limits: Optional[Tuple[int, int, int]] = None) -> Tier:
+        """Classify an item into a tier based on air date.
+        
+        Batch callers pass now/limits so the clock and config are read once.
+        """
         if not air_date:
             return Tier.COLD
         
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
         if air_date.tzinfo:
             air_date = air_date.replace(tzinfo=None)
         
         age = (now - air_date).days
+        hot_max, warm_max, cool_max = limits or self._tier_limits()
         
         if age < 0:
             # Future content - treat as hot when it airs
             return Tier.HOT
-        elif age <= (self.config.tiers.hot.max_days or 90):
+        elif age <= hot_max:
             return Tier.HOT
-        elif age <= (self.config.tiers.warm.max_days or 365):
+        elif age <= warm_max:
             return Tier.WARM
-        elif age <= (self.config.tiers.cool.max_days or 1095):
+        elif age <= cool_max:
             return Tier.COOL
         else:
             return Tier.COLD
@@ -180,40 +237,101 @@ class TierManager:
         if not date_str:
             return 'cold'
         
-        try:
-            air_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            if air_date.tzinfo:
-                air_date = air_date.replace(tzinfo=None)
-            tier = self.classify(air_date)
-            return tier.value
-        except:
-            return 'cold'
+        # Catalog pages repeat the same air/release timestamps many times
+        started, memo = self._date_tier_memo
+        now = time.monotonic()
+        if now - started >= self.DATE_TIER_MEMO_SECONDS or len(memo) >= self.DATE_TIER_MEMO_MAX:
+            memo = {}
+            self._date_tier_memo = (now, memo)
+        tier = memo.get(date_str)
+        if tier is None:
+            tier = memo[date_str] = self.classify(_parse_date(date_str)).value
+        return tier
     
     def classify_movie_date(self, movie: Dict) -> str:
         """Fast tier classification for movie from release dates - returns tier value string."""
-        # Find earliest release date
-        for date_field in ['digitalRelease', 'physicalRelease', 'inCinemas']:
+        return self.classify_from_date_str(self.movie_date_str(movie))
+    
+    @staticmethod
+    def episode_date_str(episode: Dict) -> Optional[str]:
+        """The air date string episode tiers are classified from."""
+        return episode.get('airDateUtc') or episode.get('airDate')
+    
+    @staticmethod
+    def movie_date_str(movie: Dict) -> Optional[str]:
+        """The release date string classify_movie_date uses (first one set)."""
+        for date_field in ('digitalRelease', 'physicalRelease', 'inCinemas'):
             date_str = movie.get(date_field)
             if date_str:
-                return self.classify_from_date_str(date_str)
-        return 'cold'
+                return date_str
+        return None
+    
+    def _tier_cutoffs(self) -> Tuple[str, str, str]:
+        """Oldest timestamps (ISO, to the second) still inside Hot/Warm/Cool.
+        
+        classify() puts an item in a tier when (now - date).days <= max_days,
+        i.e. when date > now - (max_days + 1) days.
+        """
+        now = datetime.utcnow()
+        return tuple(
+            (now - timedelta(days=max_days + 1)).isoformat(timespec='seconds')
+            for max_days in self._tier_limits()
+        )
+    
+    @staticmethod
+    def _is_iso_day(day: str, valid_days: set) -> bool:
+        """Check a 'YYYY-MM-DD' prefix, remembering good ones in valid_days."""
+        if len(day) != 10 or day[4] != '-' or day[7] != '-':
+            return False
+        try:
+            date.fromisoformat(day)
+        except ValueError:
+            return False
+        valid_days.add(day)
+        return True
+    
+    def count_tiers(self, date_strs: Iterable[Optional[str]]) -> Dict[str, int]:
+        """
+        Tally classify_from_date_str() over many date strings in one pass.
+        
+        The tier boundaries are turned into ISO timestamps once; each date is
+        then bucketed by string comparison of its 'YYYY-MM-DDTHH:MM:SS' prefix
+        (ISO strings sort chronologically) instead of being parsed into a
+        datetime. Each distinct day is validated once; strings that aren't ISO
+        dates take the slow path (and so land in 'cold' like before).
+        """
+        hot_cutoff, warm_cutoff, cool_cutoff = self._tier_cutoffs()
+        # Ascending cutoffs: bisect_left gives 0 (cold) .. 3 (hot) directly,
+        # with a date equal to a cutoff falling in the older tier as before
+        cutoffs = [cool_cutoff, warm_cutoff, hot_cutoff]
+        tally = [0, 0, 0, 0]
+        fallback = {'hot': 0, 'warm': 0, 'cool': 0, 'cold': 0}
+        valid_days = set()
+        for date_str in date_strs:
+            if not date_str:
+                tally[0] += 1
+            elif date_str[:10] not in valid_days and not self._is_iso_day(date_str[:10], valid_days):
+                fallback[self.classify_from_date_str(date_str)] += 1
+            else:
+                tally[bisect_left(cutoffs, date_str[:19])] += 1
+        return {
+            'hot': tally[3] + fallback['hot'],
+            'warm': tally[2] + fallback['warm'],
+            'cool': tally[1] + fallback['cool'],
+            'cold': tally[0] + fallback['cold'],
+        }
     
     def classify_episode(self, episode: Dict, series: Dict, 
-                        instance_name: str) -> TieredItem:
+                        instance_name: str, now: Optional[datetime] = None,
+                        limits: Optional[Tuple[int, int, int]] = None) -> TieredItem:
         """Create TieredItem from Sonarr episode."""
-        air_date = None
         air_date_str = episode.get('airDateUtc') or episode.get('airDate')
-        if air_date_str:
-            try:
-                air_date = datetime.fromisoformat(air_date_str.replace('Z', '+00:00'))
-                # Strip timezone for comparison
-                if air_date.tzinfo:
-                    air_date = air_date.replace(tzinfo=None)
-            except:
-                pass
+        air_date = _parse_date(air_date_str) if air_date_str else None
         
-        tier = self.classify(air_date)
-        age_days = (datetime.utcnow() - air_date).days if air_date else 9999
+        if now is None:
+            now = datetime.utcnow()
+        tier = self.classify(air_date, now, limits)
+        age_days = (now - air_date).days if air_date else 9999
         
         series_title = series.get('title', '') if series else episode.get('series', {}).get('title', '')
         ep_title = episode.get('title', '')
@@ -246,25 +364,23 @@ class TierManager:
         
         return item
     
-    def classify_movie(self, movie: Dict, instance_name: str) -> TieredItem:
+    def classify_movie(self, movie: Dict, instance_name: str,
+                       now: Optional[datetime] = None,
+                       limits: Optional[Tuple[int, int, int]] = None) -> TieredItem:
         """Create TieredItem from Radarr movie."""
         # Use digital or physical release date, whichever is earlier
         air_date = None
         for date_field in ['digitalRelease', 'physicalRelease', 'inCinemas']:
             date_str = movie.get(date_field)
             if date_str:
-                try:
-                    parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    # Strip timezone for comparison
-                    if parsed.tzinfo:
-                        parsed = parsed.replace(tzinfo=None)
-                    if not air_date or parsed < air_date:
-                        air_date = parsed
-                except:
-                    pass
+                parsed = _parse_date(date_str)
+                if parsed and (not air_date or parsed < air_date):
+                    air_date = parsed
         
-        tier = self.classify(air_date)
-        age_days = (datetime.utcnow() - air_date).days if air_date else 9999
+        if now is None:
+            now = datetime.utcnow()
+        tier = self.classify(air_date, now, limits)
+        age_days = (now - air_date).days if air_date else 9999
         
         title = movie.get('title', '')
         year = movie.get('year', '')
@@ -288,6 +404,26 @@ class TierManager:
         
         return item
     
+    def classify_episodes(self, episodes: List[Dict], instance_name: str,
+                          search_type: str = 'missing') -> List[TieredItem]:
+        """Batch classify_episode for a display list (clock and tier limits read once)."""
+        now = datetime.utcnow()
+        limits = self._tier_limits()
+        items = [self.classify_episode(ep, {}, instance_name, now, limits) for ep in episodes]
+        for item in items:
+            item.search_type = search_type
+        return items
+    
+    def classify_movies(self, movies: List[Dict], instance_name: str,
+                        search_type: str = 'missing') -> List[TieredItem]:
+        """Batch classify_movie for a display list (clock and tier limits read once)."""
+        now = datetime.utcnow()
+        limits = self._tier_limits()
+        items = [self.classify_movie(movie, instance_name, now, limits) for movie in movies]
+        for item in items:
+            item.search_type = search_type
+        return items
+    
     def record_search(self, item: TieredItem):
         """Record that an item was searched."""
         key = f"{item.source}:{item.id}"
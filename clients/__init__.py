@@ -3,5 +3,6 @@
 from .sonarr import SonarrClient
 from .radarr import RadarrClient
 from .sabnzbd import SABnzbdClient
+from .base import APIError
 
-__all__ = ['SonarrClient', 'RadarrClient', 'SABnzbdClient']
+__all__ = ['SonarrClient', 'RadarrClient', 'SABnzbdClient', 'APIError']
@@ -6,16 +6,77 @@ external dependencies. TFM aims to be lightweight and easy to deploy.
 
 RESPONSE TIME TRACKING: Every API call is timed. This data enables future
 auto-tuning (adjusting timeouts, batch sizes based on server performance).
+
+CONDITIONAL GETS: Callers can opt into ETag caching per request. The last
+ETag and parsed body are kept per URL (least recently used URLs beyond
+ETAG_CACHE_MAX_ENTRIES are dropped); a 304 reply reuses the cached body and
+skips the download + JSON parse. A cached body is handed to every caller that
+gets the 304, so callers must treat ETag-cached results as read-only. Servers
+that send no ETag simply never populate the cache.
+
+COMPRESSION: Requests advertise gzip/deflate. Large paged JSON (wanted/*,
+queue, series) is mostly repeated keys and shrinks ~10x on the wire; the body
+is inflated here with the stdlib (no brotli - that would need a dependency).
+
+RETRIES: Idempotent requests (GET/PUT/DELETE) that get a transient status
+(429/502/503/504, e.g. an *arr restarting or rate limiting) are retried a
+couple of times with exponential backoff and jitter, honouring a short
+Retry-After. POSTs (grabs, commands) are never retried - a repeat could
+act twice.
+
+KEEP-ALIVE: Each client holds one persistent HTTP/1.1 connection per thread
+(http.client), so paging and dashboard fan-out skip a TCP/TLS handshake per
+call. A connection the server dropped while idle is retried once; redirects
+fall back to a one-shot urllib request. When an HTTP(S)_PROXY environment
+variable applies to the instance's host (i.e. it isn't excluded by no_proxy),
+every request goes through urllib instead, so proxied setups keep working
+without keep-alive.
 """
 
 import json
+import random
+import threading
+import time
+import zlib
+import http.client
+from collections import OrderedDict
 import urllib.request
 import urllib.error
 import urllib.parse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
 
+# Transient statuses retried for idempotent methods, and the backoff used
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.25  # seconds, doubled per attempt
+RETRY_MAX_DELAY = 4.0
+
+# Per-client bound on ETag-cached responses (64 pages of 100 wanted/* records)
+ETAG_CACHE_MAX_ENTRIES = 64
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> Optional[float]:
+    """Backoff before retry number attempt+1, or None if Retry-After asks for too long."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random() / 2)
+    if retry_after and retry_after.strip().isdigit():
+        wanted = float(retry_after)
+        if wanted > RETRY_MAX_DELAY:
+            return None
+        delay = max(delay, wanted)
+    return delay
+
+
+def _inflate(raw: bytes) -> bytes:
+    """Decode a 'deflate' body - zlib-wrapped per spec, raw DEFLATE from some servers."""
+    try:
+        return zlib.decompress(raw)
+    except zlib.error:
+        return zlib.decompress(raw, -zlib.MAX_WBITS)
+
+
 class APIError(Exception):
     """
     Exception raised for API errors.
@@ -46,6 +107,11 @@ class BaseClient(ABC):
         self.api_key = api_key
         self.name = name or self.__class__.__name__
         self.timeout = 120  # Increased for large libraries (100k+ items)
+        # url -> (etag, parsed body), least recently used first
+        self._etag_cache: 'OrderedDict[str, Tuple[str, Any]]' = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._local = threading.local()  # per-thread keep-alive connection
+        self._use_proxy = self._proxy_applies(self.base_url)
     
     @property
     @abstractmethod
@@ -67,49 +133,157 @@ class BaseClient(ABC):
             'X-Api-Key': self.api_key,
             'Content-Type': 'application/json',
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
         }
     
+    @staticmethod
+    def _read_body(response) -> str:
+        """Read a response body, inflating gzip/deflate content."""
+        raw = response.read()
+        encoding = (response.headers.get('Content-Encoding') or '').lower()
+        if raw and encoding in ('gzip', 'deflate'):
+            # wbits 47 = auto-detect zlib or gzip header
+            raw = zlib.decompress(raw, 47) if encoding == 'gzip' else _inflate(raw)
+        return raw.decode('utf-8')
+    
+    @staticmethod
+    def _proxy_applies(base_url: str) -> bool:
+        """Whether urllib would send requests for base_url through a proxy."""
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme not in urllib.request.getproxies():
+            return False
+        return not urllib.request.proxy_bypass(parts.hostname or '')
+    
+    def _get_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get this thread's keep-alive connection. Returns (conn, was_reused)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            parts = urllib.parse.urlsplit(self.base_url)
+            conn_cls = (http.client.HTTPSConnection if parts.scheme == 'https'
+                        else http.client.HTTPConnection)
+            conn = conn_cls(parts.netloc, timeout=self.timeout)
+            self._local.conn = conn
+        # http.client drops .sock when the server asked to close; the next
+        # request then reconnects on its own
+        return conn, conn.sock is not None
+    
+    def _send(self, method: str, url: str, body: Optional[bytes],
+              headers: Dict[str, str]) -> Tuple[int, str, str, Any]:
+        """Send a request over the keep-alive connection.
+        
+        Returns (status, reason, body text, response headers). Redirects are
+        handed to urllib so they are followed exactly as before, as is every
+        request when a proxy applies (http.client ignores the proxy settings).
+        """
+        if self._use_proxy:
+            return self._send_urllib(method, url, body, headers)
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        
+        for attempt in (1, 2):
+            conn, reused = self._get_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                if response.status in (301, 302, 303, 307, 308):
+                    response.read()
+                    return self._send_urllib(method, url, body, headers)
+                return response.status, response.reason, self._read_body(response), response.headers
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                # An idle connection the server already closed - retry once fresh
+                if not reused or attempt == 2:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+    
+    def _send_urllib(self, method: str, url: str, body: Optional[bytes],
+                     headers: Dict[str, str]) -> Tuple[int, str, str, Any]:
+        """One-shot urllib request (follows redirects). Same return shape as _send."""
+        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, response.reason, self._read_body(response), response.headers
+        except urllib.error.HTTPError as e:
+            response_body = ""
+            try:
+                response_body = self._read_body(e)
+            except (OSError, http.client.HTTPException, zlib.error):
+                pass
+            return e.code, e.reason, response_body, e.headers
+    
     def _request(self, method: str, endpoint: str, 
                  params: Optional[Dict] = None,
-                 data: Optional[Dict] = None) -> Any:
+                 data: Optional[Dict] = None,
+                 use_etag_cache: bool = False) -> Any:
         """Make HTTP request with response time tracking."""
-        import time
         url = self._build_url(endpoint, params)
         headers = self._get_headers()
         
+        cached = None
+        if use_etag_cache:
+            with self._etag_lock:
+                cached = self._etag_cache.get(url)
+                if cached:
+                    self._etag_cache.move_to_end(url)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+        
         body = None
         if data is not None:
             body = json.dumps(data).encode('utf-8')
         
-        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        attempts = RETRY_ATTEMPTS if method in RETRY_METHODS else 1
+        for attempt in range(attempts):
+            start_time = time.time()
+            try:
+                status, reason, content, response_headers = self._send(method, url, body, headers)
+            except urllib.error.URLError as e:
+                raise APIError(f"Connection error: {e.reason}")
+            except zlib.error as e:
+                raise APIError(f"Invalid compressed response: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                raise APIError(f"Connection error: {e}")
+            
+            # Track response time for auto-tuning
+            elapsed_ms = (time.time() - start_time) * 1000
+            
+            if status not in RETRY_STATUSES or attempt == attempts - 1:
+                break
+            delay = _retry_delay(attempt, response_headers.get('Retry-After'))
+            if delay is None:
+                break
+            time.sleep(delay)
         
-        start_time = time.time()
+        if status == 304 and cached:
+            # Not modified - reuse the body parsed last time
+            self._update_response_metrics(elapsed_ms)
+            return cached[1]
+        if status >= 300:
+            raise APIError(f"HTTP {status}: {reason}", status_code=status, response=content)
+        
+        self._update_response_metrics(elapsed_ms)
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                content = response.read().decode('utf-8')
-                
-                # Track response time for auto-tuning
-                elapsed_ms = (time.time() - start_time) * 1000
-                self._update_response_metrics(elapsed_ms)
-                
-                if content:
-                    return json.loads(content)
-                return {}
-        except urllib.error.HTTPError as e:
-            response_body = ""
-            try:
-                response_body = e.read().decode('utf-8')
-            except:
-                pass
-            raise APIError(
-                f"HTTP {e.code}: {e.reason}",
-                status_code=e.code,
-                response=response_body
-            )
-        except urllib.error.URLError as e:
-            raise APIError(f"Connection error: {e.reason}")
+            result = json.loads(content) if content else {}
         except json.JSONDecodeError as e:
             raise APIError(f"Invalid JSON response: {e}")
+        
+        if use_etag_cache:
+            etag = response_headers.get('ETag')
+            if etag:
+                with self._etag_lock:
+                    self._etag_cache[url] = (etag, result)
+                    self._etag_cache.move_to_end(url)
+                    while len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                        self._etag_cache.popitem(last=False)
+        return result
+    
+    def discard_etag_cache(self, endpoint: str, params: Optional[Dict] = None) -> bool:
+        """Drop the ETag-cached response for a GET, if any. Returns whether one was cached."""
+        url = self._build_url(endpoint, params)
+        with self._etag_lock:
+            return self._etag_cache.pop(url, None) is not None
     
     def _update_response_metrics(self, elapsed_ms: float):
         """Track response times for auto-tuning (exponential moving average)."""
@@ -126,9 +300,10 @@ class BaseClient(ABC):
         """Get average response time in milliseconds."""
         return getattr(self, '_avg_response_ms', 500)
     
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
-        """HTTP GET request."""
-        return self._request('GET', endpoint, params=params)
+    def get(self, endpoint: str, params: Optional[Dict] = None,
+            use_etag_cache: bool = False) -> Any:
+        """HTTP GET request. With use_etag_cache, unchanged responses (304) reuse the last body."""
+        return self._request('GET', endpoint, params=params, use_etag_cache=use_etag_cache)
     
     def post(self, endpoint: str, data: Optional[Dict] = None,
              params: Optional[Dict] = None) -> Any:
@@ -139,9 +314,10 @@ class BaseClient(ABC):
         """HTTP PUT request."""
         return self._request('PUT', endpoint, data=data or {})
     
-    def delete(self, endpoint: str, params: Optional[Dict] = None) -> Any:
-        """HTTP DELETE request."""
-        return self._request('DELETE', endpoint, params=params)
+    def delete(self, endpoint: str, params: Optional[Dict] = None,
+               data: Optional[Dict] = None) -> Any:
+        """HTTP DELETE request (bulk endpoints take a JSON body)."""
+        return self._request('DELETE', endpoint, params=params, data=data)
     
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to the service."""
@@ -8,9 +8,26 @@ from datetime import datetime, timedelta
 from .base import BaseClient, APIError
 
 
+# Query-string spelling of booleans for the *arr API
+_BSTR = {True: 'true', False: 'false'}
+
+
 class RadarrClient(BaseClient):
     """Client for Radarr API v3."""
     
+    # Queue issue detection: (issue_type, lowercase substrings) pairs.
+    # Immutable and built once with the class, not per parse_queue_status call.
+    _ISSUE_PATTERNS = (
+        ('no_files_found', ('no files found', 'eligible for import')),
+        ('sample_only', ('sample',)),
+        ('not_an_upgrade', ('not an upgrade', 'existing file')),
+        ('unknown_movie', ('unknown movie',)),
+        ('import_failed', ('import failed', 'failed to import')),
+        ('download_failed', ('download failed', 'failed to download')),
+        ('path_not_valid', ('path not valid', 'path does not exist')),
+        ('no_audio_tracks', ('no audio', 'audio track')),
+    )
+    
     @property
     def api_version(self) -> str:
         return "/api/v3"
@@ -39,31 +56,7 @@ class RadarrClient(BaseClient):
             return result.get('records', [])
         
         # All pages mode (original behavior)
-        all_missing = []
-        current_page = 1
-        fetch_size = 100
-        
-        while True:
-            result = self.get('wanted/missing', params={
-                'page': current_page,
-                'pageSize': fetch_size,
-                'sortKey': 'digitalRelease',
-                'sortDirection': 'descending',
-                'monitored': True
-            })
-            
-            records = result.get('records', [])
-            all_missing.extend(records)
-            
-            if len(records) < fetch_size:
-                break
-            current_page += 1
-            
-            # Safety limit - 500 pages = 50,000 items max
-            if current_page > 500:
-                break
-        
-        return all_missing
+        return self._get_all_records('wanted/missing')
     
     def get_cutoff_unmet(self, page: int = None, page_size: int = None) -> List[Dict]:
         """Get movies that don't meet quality cutoff. If page specified, returns single page."""
@@ -79,21 +72,48 @@ class RadarrClient(BaseClient):
             return result.get('records', [])
         
         # All pages mode (original behavior)
-        all_cutoff = []
+        return self._get_all_records('wanted/cutoff')
+    
+    def get_missing_count(self) -> int:
+        """Number of monitored missing movies, without downloading the list."""
+        return self._get_total_records('wanted/missing')
+    
+    def get_cutoff_unmet_count(self) -> int:
+        """Number of movies below quality cutoff, without downloading the list."""
+        return self._get_total_records('wanted/cutoff')
+    
+    def _get_total_records(self, endpoint: str) -> int:
+        """Read totalRecords from a one-record page of a paged endpoint."""
+        result = self.get(endpoint, params={
+            'page': 1,
+            'pageSize': 1,
+            'monitored': True
+        })
+        return int(result.get('totalRecords', 0))
+    
+    def _get_all_records(self, endpoint: str) -> List[Dict]:
+        """Page through a wanted/* endpoint, accumulating only the record lists.
+        
+        Pages go through the ETag cache, so pages that haven't changed since
+        the last sweep come back as a 304 and reuse the body parsed then.
+        """
+        all_records = []
         current_page = 1
         fetch_size = 100
         
-        while True:
-            result = self.get('wanted/cutoff', params={
-                'page': current_page,
+        def page_params(page):
+            return {
+                'page': page,
                 'pageSize': fetch_size,
                 'sortKey': 'digitalRelease',
                 'sortDirection': 'descending',
                 'monitored': True
-            })
-            
-            records = result.get('records', [])
-            all_cutoff.extend(records)
+            }
+        
+        while True:
+            records = self.get(endpoint, params=page_params(current_page),
+                               use_etag_cache=True).get('records') or []
+            all_records.extend(records)
             
             if len(records) < fetch_size:
                 break
@@ -103,7 +123,12 @@ class RadarrClient(BaseClient):
             if current_page > 500:
                 break
         
-        return all_cutoff
+        # The list shrank: pages past its end would otherwise stay cached
+        stale_page = current_page + 1
+        while self.discard_etag_cache(endpoint, page_params(stale_page)):
+            stale_page += 1
+        
+        return all_records
     
     # ==================== Queue ====================
     
@@ -128,9 +153,9 @@ class RadarrClient(BaseClient):
         """Delete item from queue, optionally blocklisting."""
         try:
             self.delete(f'queue/{queue_id}', params={
-                'removeFromClient': str(remove_from_client).lower(),
-                'blocklist': str(blocklist).lower(),
-                'skipRedownload': str(skip_redownload).lower()
+                'removeFromClient': _BSTR[remove_from_client],
+                'blocklist': _BSTR[blocklist],
+                'skipRedownload': _BSTR[skip_redownload]
             })
             # DELETE returns empty on success
             return True
@@ -144,6 +169,26 @@ class RadarrClient(BaseClient):
             print(f"delete_queue_item unexpected error: {e}")
             return False
     
+    def delete_queue_items_bulk(self, queue_ids: List[int], blocklist: bool = True,
+                                remove_from_client: bool = True,
+                                skip_redownload: bool = False) -> bool:
+        """Delete several queue items in one request (DELETE queue/bulk)."""
+        if not queue_ids:
+            return True
+        try:
+            self.delete('queue/bulk', params={
+                'removeFromClient': _BSTR[remove_from_client],
+                'blocklist': _BSTR[blocklist],
+                'skipRedownload': _BSTR[skip_redownload]
+            }, data={'ids': list(queue_ids)})
+            return True
+        except APIError as e:
+            print(f"delete_queue_items_bulk error: {e}")
+            return False
+        except Exception as e:
+            print(f"delete_queue_items_bulk unexpected error: {e}")
+            return False
+    
     # ==================== Releases & Search ====================
     
     def search_movie(self, movie_id: int) -> Dict:
@@ -449,27 +494,23 @@ class RadarrClient(BaseClient):
             'resolution_type': None,
         }
         
-        # Parse status messages
-        for msg in queue_item.get('statusMessages', []):
+        # Healthy items carry no status messages - nothing to match against
+        msgs = queue_item.get('statusMessages') or ()
+        if not msgs and not status['error_message']:
+            return status
+        
+        # Parse status messages (lowercased copies kept for pattern matching)
+        lowered = []
+        for msg in msgs:
             title = msg.get('title', '')
-            messages = msg.get('messages', [])
-            status['messages'].extend(messages if messages else [title])
+            messages = msg.get('messages', []) or [title]
+            status['messages'].extend(messages)
+            lowered.extend(m.lower() for m in messages)
         
         # Identify specific issues
-        all_messages = ' '.join(status['messages']).lower()
-        
-        issue_patterns = {
-            'no_files_found': ['no files found', 'eligible for import'],
-            'sample_only': ['sample'],
-            'not_an_upgrade': ['not an upgrade', 'existing file'],
-            'unknown_movie': ['unknown movie'],
-            'import_failed': ['import failed', 'failed to import'],
-            'download_failed': ['download failed', 'failed to download'],
-            'path_not_valid': ['path not valid', 'path does not exist'],
-            'no_audio_tracks': ['no audio', 'audio track'],
-        }
+        all_messages = ' '.join(lowered)
         
-        for issue_type, patterns in issue_patterns.items():
+        for issue_type, patterns in self._ISSUE_PATTERNS:
             if any(p in all_messages for p in patterns):
                 status['issues'].append(issue_type)
         
@@ -501,13 +542,13 @@ class RadarrClient(BaseClient):
         """Unmonitor a specific movie."""
         try:
             # Get movie first
-            movie = self._get(f'/movie/{movie_id}')
+            movie = self.get(f'movie/{movie_id}')
             if not movie:
                 return False
             
             # Update monitored status
             movie['monitored'] = False
-            self._put(f'/movie/{movie_id}', movie)
+            self.put(f'movie/{movie_id}', movie)
             return True
         except Exception as e:
             print(f"Failed to unmonitor movie {movie_id}: {e}")
@@ -530,7 +571,7 @@ class RadarrClient(BaseClient):
                 'deleteFiles': str(delete_files).lower(),
                 'addImportExclusion': str(add_exclusion).lower()
             }
-            self._delete(f'/movie/{movie_id}', params=params)
+            self.delete(f'movie/{movie_id}', params=params)
             return True
         except Exception as e:
             print(f"Failed to delete movie {movie_id}: {e}")
@@ -7,10 +7,32 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from .base import BaseClient, APIError
 
+# Shared stand-in for series without a statistics block (never mutated)
+_EMPTY_STATS: Dict[str, Any] = {}
+
+
+# Query-string spelling of booleans for the *arr API
+_BSTR = {True: 'true', False: 'false'}
+
 
 class SonarrClient(BaseClient):
     """Client for Sonarr API v3."""
     
+    # Queue issue detection: (issue_type, lowercase substrings) pairs.
+    # Immutable and built once with the class, not per parse_queue_status call.
+    _ISSUE_PATTERNS = (
+        ('no_files_found', ('no files found', 'eligible for import')),
+        ('sample_only', ('sample',)),
+        ('not_an_upgrade', ('not an upgrade', 'existing file')),
+        ('unknown_series', ('unknown series',)),
+        ('unexpected_episode', ('unexpected', 'was unexpected')),
+        ('invalid_season_episode', ('invalid season', 'invalid episode', 'unable to identify')),
+        ('no_audio_tracks', ('no audio', 'audio track')),
+        ('import_failed', ('import failed', 'failed to import')),
+        ('download_failed', ('download failed', 'failed to download')),
+        ('path_not_valid', ('path not valid', 'path does not exist')),
+    )
+    
     @property
     def api_version(self) -> str:
         return "/api/v3"
@@ -50,31 +72,7 @@ class SonarrClient(BaseClient):
             return result.get('records', [])
         
         # All pages mode (original behavior)
-        all_missing = []
-        current_page = 1
-        fetch_size = 100
-        
-        while True:
-            result = self.get('wanted/missing', params={
-                'page': current_page,
-                'pageSize': fetch_size,
-                'sortKey': 'airDateUtc',
-                'sortDirection': 'descending',
-                'monitored': True
-            })
-            
-            records = result.get('records', [])
-            all_missing.extend(records)
-            
-            if len(records) < fetch_size:
-                break
-            current_page += 1
-            
-            # Safety limit - 500 pages = 50,000 items max
-            if current_page > 500:
-                break
-        
-        return all_missing
+        return self._get_all_records('wanted/missing')
     
     def get_cutoff_unmet(self, page: int = None, page_size: int = None) -> List[Dict]:
         """Get episodes that don't meet quality cutoff. If page specified, returns single page."""
@@ -90,21 +88,48 @@ class SonarrClient(BaseClient):
             return result.get('records', [])
         
         # All pages mode (original behavior)
-        all_cutoff = []
+        return self._get_all_records('wanted/cutoff')
+    
+    def get_missing_count(self) -> int:
+        """Number of monitored missing episodes, without downloading the list."""
+        return self._get_total_records('wanted/missing')
+    
+    def get_cutoff_unmet_count(self) -> int:
+        """Number of episodes below quality cutoff, without downloading the list."""
+        return self._get_total_records('wanted/cutoff')
+    
+    def _get_total_records(self, endpoint: str) -> int:
+        """Read totalRecords from a one-record page of a paged endpoint."""
+        result = self.get(endpoint, params={
+            'page': 1,
+            'pageSize': 1,
+            'monitored': True
+        })
+        return int(result.get('totalRecords', 0))
+    
+    def _get_all_records(self, endpoint: str) -> List[Dict]:
+        """Page through a wanted/* endpoint, accumulating only the record lists.
+        
+        Pages are kept small (100 records) so the raw JSON text alive during a
+        parse is bounded by one page rather than the whole result set.
+        """
+        all_records = []
         current_page = 1
         fetch_size = 100
         
-        while True:
-            result = self.get('wanted/cutoff', params={
-                'page': current_page,
+        def page_params(page):
+            return {
+                'page': page,
                 'pageSize': fetch_size,
                 'sortKey': 'airDateUtc',
                 'sortDirection': 'descending',
                 'monitored': True
-            })
-            
-            records = result.get('records', [])
-            all_cutoff.extend(records)
+            }
+        
+        while True:
+            records = self.get(endpoint, params=page_params(current_page),
+                               use_etag_cache=True).get('records') or []
+            all_records.extend(records)
             
             if len(records) < fetch_size:
                 break
@@ -114,7 +139,12 @@ class SonarrClient(BaseClient):
             if current_page > 500:
                 break
         
-        return all_cutoff
+        # The list shrank: pages past its end would otherwise stay cached
+        stale_page = current_page + 1
+        while self.discard_etag_cache(endpoint, page_params(stale_page)):
+            stale_page += 1
+        
+        return all_records
     
     # ==================== Queue ====================
     
@@ -141,9 +171,9 @@ class SonarrClient(BaseClient):
         """Delete item from queue, optionally blocklisting."""
         try:
             self.delete(f'queue/{queue_id}', params={
-                'removeFromClient': str(remove_from_client).lower(),
-                'blocklist': str(blocklist).lower(),
-                'skipRedownload': str(skip_redownload).lower()
+                'removeFromClient': _BSTR[remove_from_client],
+                'blocklist': _BSTR[blocklist],
+                'skipRedownload': _BSTR[skip_redownload]
             })
             # DELETE returns empty on success
             return True
@@ -157,6 +187,26 @@ class SonarrClient(BaseClient):
             print(f"delete_queue_item unexpected error: {e}")
             return False
     
+    def delete_queue_items_bulk(self, queue_ids: List[int], blocklist: bool = True,
+                                remove_from_client: bool = True,
+                                skip_redownload: bool = False) -> bool:
+        """Delete several queue items in one request (DELETE queue/bulk)."""
+        if not queue_ids:
+            return True
+        try:
+            self.delete('queue/bulk', params={
+                'removeFromClient': _BSTR[remove_from_client],
+                'blocklist': _BSTR[blocklist],
+                'skipRedownload': _BSTR[skip_redownload]
+            }, data={'ids': list(queue_ids)})
+            return True
+        except APIError as e:
+            print(f"delete_queue_items_bulk error: {e}")
+            return False
+        except Exception as e:
+            print(f"delete_queue_items_bulk unexpected error: {e}")
+            return False
+    
     # ==================== Releases & Search ====================
     
     def search_episode(self, episode_id: int) -> Dict:
@@ -439,17 +489,12 @@ class SonarrClient(BaseClient):
         """Get library statistics."""
         series_list = self.get_series()
         
-        total_episodes = 0
-        have_episodes = 0
-        missing_episodes = 0
-        monitored_series = 0
-        
-        for series in series_list:
-            if series.get('monitored'):
-                monitored_series += 1
-            stats = series.get('statistics', {})
-            total_episodes += stats.get('totalEpisodeCount', 0)
-            have_episodes += stats.get('episodeFileCount', 0)
+        # Resolve each series' statistics block once, then let sum() do the
+        # reductions - large libraries have thousands of series here
+        stats_blocks = [s.get('statistics') or _EMPTY_STATS for s in series_list]
+        monitored_series = sum(1 for s in series_list if s.get('monitored'))
+        total_episodes = sum(st.get('totalEpisodeCount', 0) for st in stats_blocks)
+        have_episodes = sum(st.get('episodeFileCount', 0) for st in stats_blocks)
         
         missing_episodes = total_episodes - have_episodes
         
@@ -500,29 +545,23 @@ class SonarrClient(BaseClient):
             'resolution_type': None,
         }
         
-        # Parse status messages
-        for msg in queue_item.get('statusMessages', []):
+        # Healthy items carry no status messages - nothing to match against
+        msgs = queue_item.get('statusMessages') or ()
+        if not msgs and not status['error_message']:
+            return status
+        
+        # Parse status messages (lowercased copies kept for pattern matching)
+        lowered = []
+        for msg in msgs:
             title = msg.get('title', '')
-            messages = msg.get('messages', [])
-            status['messages'].extend(messages if messages else [title])
+            messages = msg.get('messages', []) or [title]
+            status['messages'].extend(messages)
+            lowered.extend(m.lower() for m in messages)
         
         # Identify specific issues
-        all_messages = ' '.join(status['messages']).lower()
-        
-        issue_patterns = {
-            'no_files_found': ['no files found', 'eligible for import'],
-            'sample_only': ['sample'],
-            'not_an_upgrade': ['not an upgrade', 'existing file'],
-            'unknown_series': ['unknown series'],
-            'unexpected_episode': ['unexpected', 'was unexpected'],
-            'invalid_season_episode': ['invalid season', 'invalid episode', 'unable to identify'],
-            'no_audio_tracks': ['no audio', 'audio track'],
-            'import_failed': ['import failed', 'failed to import'],
-            'download_failed': ['download failed', 'failed to download'],
-            'path_not_valid': ['path not valid', 'path does not exist'],
-        }
+        all_messages = ' '.join(lowered)
         
-        for issue_type, patterns in issue_patterns.items():
+        for issue_type, patterns in self._ISSUE_PATTERNS:
             if any(p in all_messages for p in patterns):
                 status['issues'].append(issue_type)
         
@@ -532,13 +571,13 @@ class SonarrClient(BaseClient):
         """Unmonitor a specific episode."""
         try:
             # Get episode first
-            episode = self._get(f'/episode/{episode_id}')
+            episode = self.get(f'episode/{episode_id}')
             if not episode:
                 return False
             
             # Update monitored status
             episode['monitored'] = False
-            self._put(f'/episode/{episode_id}', episode)
+            self.put(f'episode/{episode_id}', episode)
             return True
         except Exception as e:
             print(f"Failed to unmonitor episode {episode_id}: {e}")
@@ -561,7 +600,7 @@ class SonarrClient(BaseClient):
                 'deleteFiles': str(delete_files).lower(),
                 'addImportListExclusion': str(add_exclusion).lower()
             }
-            self._delete(f'/series/{series_id}', params=params)
+            self.delete(f'series/{series_id}', params=params)
             return True
         except Exception as e:
             print(f"Failed to delete series {series_id}: {e}")
@@ -570,6 +609,6 @@ class SonarrClient(BaseClient):
     def get_episode(self, episode_id: int) -> Optional[Dict]:
         """Get episode details including series ID."""
         try:
-            return self._get(f'/episode/{episode_id}')
+            return self.get(f'episode/{episode_id}')
         except:
             return None
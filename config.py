@@ -4,43 +4,57 @@ Supports JSON file and environment variable configuration.
 """
 
 import os
+import sys
 import json
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 import threading
+from functools import cached_property
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceInstance:
-    """Configuration for a single service instance."""
+    """Configuration for a single service instance (immutable - replace, don't edit)."""
     name: str = ""
     url: str = ""
     api_key: str = ""
     enabled: bool = False
+    # Derived from the fields above once, at construction
+    _valid: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_valid', bool(self.url and self.api_key and self.enabled))
     
     def is_valid(self) -> bool:
-        return bool(self.url and self.api_key and self.enabled)
+        return self._valid
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TierSettings:
-    """Settings for a single tier."""
+    """Settings for a single tier (immutable - swap in a new one to change it)."""
     min_days: int = 0
     max_days: Optional[int] = None
     interval_minutes: int = 60
 
 
-@dataclass
+# Default tier settings - shared safely since TierSettings is frozen
+_DEFAULT_HOT = TierSettings(min_days=0, max_days=90, interval_minutes=60)
+_DEFAULT_WARM = TierSettings(min_days=90, max_days=365, interval_minutes=360)
+_DEFAULT_COOL = TierSettings(min_days=365, max_days=1095, interval_minutes=1440)
+_DEFAULT_COLD = TierSettings(min_days=1095, max_days=None, interval_minutes=10080)
+
+
+@dataclass(slots=True)
 class TierConfig:
     """Tier threshold configuration."""
-    hot: TierSettings = field(default_factory=lambda: TierSettings(min_days=0, max_days=90, interval_minutes=60))
-    warm: TierSettings = field(default_factory=lambda: TierSettings(min_days=90, max_days=365, interval_minutes=360))
-    cool: TierSettings = field(default_factory=lambda: TierSettings(min_days=365, max_days=1095, interval_minutes=1440))
-    cold: TierSettings = field(default_factory=lambda: TierSettings(min_days=1095, max_days=None, interval_minutes=10080))
+    hot: TierSettings = _DEFAULT_HOT
+    warm: TierSettings = _DEFAULT_WARM
+    cool: TierSettings = _DEFAULT_COOL
+    cold: TierSettings = _DEFAULT_COLD
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoResolutionConfig:
     """Auto-resolution settings for stuck queue items."""
     enabled: bool = True
@@ -59,7 +73,7 @@ class AutoResolutionConfig:
     wait_minutes_before_action: int = 30  # Wait before auto-resolving
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchConfig:
     """
     Search configuration - USER TUNABLE settings.
@@ -91,9 +105,17 @@ class SearchConfig:
     prefer_series_over_episode: bool = True
     prefer_episode_over_season_pack: bool = True
     randomize_selection: bool = True
+    
+    def __post_init__(self):
+        # Reject impossible tier shares up front so the searcher's per-cycle
+        # split can use them as-is
+        for name in ('hot_percent', 'warm_percent', 'cool_percent', 'cold_percent'):
+            value = getattr(self, name)
+            if not 0 <= value <= 100:
+                raise ValueError(f"search.{name} must be between 0 and 100 (got {value})")
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailConfig:
     """Email notification configuration."""
     enabled: bool = False
@@ -109,7 +131,7 @@ class EmailConfig:
     batch_interval_minutes: int = 60
 
 
-@dataclass
+@dataclass(slots=True)
 class QuietHoursConfig:
     """Quiet hours configuration - pause searching during specific hours."""
     enabled: bool = False
@@ -117,7 +139,7 @@ class QuietHoursConfig:
     end_hour: int = 7    # 7 AM
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageConfig:
     """Storage monitoring configuration."""
     enabled: bool = True
@@ -126,26 +148,98 @@ class StorageConfig:
     paths_to_monitor: List[str] = field(default_factory=list)
 
 
+def _build_tiers(tiers_data: Dict[str, Any]) -> TierConfig:
+    """Build TierConfig; tiers missing or malformed in the file get TierSettings()."""
+    return TierConfig(
+        hot=TierSettings(**tiers_data.get('hot', {})) if isinstance(tiers_data.get('hot'), dict) else TierSettings(),
+        warm=TierSettings(**tiers_data.get('warm', {})) if isinstance(tiers_data.get('warm'), dict) else TierSettings(),
+        cool=TierSettings(**tiers_data.get('cool', {})) if isinstance(tiers_data.get('cool'), dict) else TierSettings(),
+        cold=TierSettings(**tiers_data.get('cold', {})) if isinstance(tiers_data.get('cold'), dict) else TierSettings(),
+    )
+
+
+# Feature section key -> builder taking that section's raw dict
+_SECTION_BUILDERS = {
+    'tiers': _build_tiers,
+    'auto_resolution': lambda d: AutoResolutionConfig(**d),
+    'search': lambda d: SearchConfig(**d),
+    'email': lambda d: EmailConfig(**d),
+    'quiet_hours': lambda d: QuietHoursConfig(**d),
+    # paths_to_monitor is a list - default it for configs saved without one
+    'storage': lambda d: StorageConfig(**{'paths_to_monitor': [], **d}),
+}
+
+
+# Single-instance env var setup: (instance name, URL var, API key var, Config attribute)
+_ENV_INSTANCES = (
+    ('Sonarr', 'SONARR_URL', 'SONARR_API_KEY', 'sonarr_instances'),
+    ('Radarr', 'RADARR_URL', 'RADARR_API_KEY', 'radarr_instances'),
+    ('SABnzbd', 'SABNZBD_URL', 'SABNZBD_API_KEY', 'sabnzbd_instances'),
+)
+
+
+def _interned_object(pairs) -> Dict[str, Any]:
+    """json object_pairs_hook: intern keys so the field names the loader sees
+    (name, url, api_key, ...) are the same objects as the dataclass kwargs."""
+    return {sys.intern(k): v for k, v in pairs}
+
+
+# Reused for every save(); json.dumps(indent=...) builds a new encoder per call
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _fast_asdict(obj) -> Dict[str, Any]:
+    """
+    Flat replacement for dataclasses.asdict() on the config sections.
+    
+    Sections hold scalars (plus StorageConfig's path list, which is copied),
+    so asdict()'s recursive deepcopy walk buys nothing here. Private derived
+    fields (e.g. ServiceInstance._valid) are not serialized.
+    """
+    data = {}
+    for name in obj.__dataclass_fields__:
+        if name[0] == '_':
+            continue
+        value = getattr(obj, name)
+        data[name] = list(value) if isinstance(value, list) else value
+    return data
+
+
+def _tiers_asdict(tiers: TierConfig) -> Dict[str, Any]:
+    """Serialize TierConfig - its four fields are known, so skip introspection."""
+    return {
+        'hot': _fast_asdict(tiers.hot),
+        'warm': _fast_asdict(tiers.warm),
+        'cool': _fast_asdict(tiers.cool),
+        'cold': _fast_asdict(tiers.cold),
+    }
+
+
 class Config:
     """Main configuration class."""
     
     def __init__(self, config_path: str = "/config/config.json"):
         self.config_path = Path(config_path)
         self.data_dir = self.config_path.parent  # Store data files next to config
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # guards in-memory state only
+        self._save_lock = threading.Lock()  # serializes encode + disk write
+        
+        # Serialized snapshot for to_dict()/save(), rebuilt only when dirty
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._dirty = True
+        self._saved_hash: Optional[int] = None  # hash of the JSON last written
+        self._save_seq = 0     # bumped per save() snapshot
+        self._written_seq = 0  # snapshot seq last written to disk
         
         # Service instances (support multiple)
+        self._enabled_cache: Dict[str, List[ServiceInstance]] = {}  # service -> valid instances
         self.sonarr_instances: List[ServiceInstance] = []
         self.radarr_instances: List[ServiceInstance] = []
         self.sabnzbd_instances: List[ServiceInstance] = []
         
-        # Feature configs
-        self.tiers = TierConfig()
-        self.auto_resolution = AutoResolutionConfig()
-        self.search = SearchConfig()
-        self.email = EmailConfig()
-        self.quiet_hours = QuietHoursConfig()
-        self.storage = StorageConfig()
+        # Feature configs (tiers, search, ...) are cached properties built from
+        # the raw file data on first access - see _build_section
+        self._raw: Dict[str, Any] = {}
         
         # App settings
         self.app_name = "The Fantastic Machinarr"
@@ -158,149 +252,219 @@ class Config:
     
     def _load(self):
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                self._apply_dict(data)
-            except Exception as e:
-                print(f"Warning: Could not load config: {e}")
+        try:
+            with open(self.config_path, 'rb') as f:
+                data = json.load(f, object_pairs_hook=_interned_object)
+            self._raw = data
+            self._apply_dict(data, include_sections=False)
+        except FileNotFoundError:
+            pass  # First run - defaults until the wizard saves
+        except Exception as e:
+            print(f"Warning: Could not load config: {e}")
     
-    def _apply_dict(self, data: Dict[str, Any]):
-        """Apply dictionary to configuration."""
+    def _apply_dict(self, data: Dict[str, Any], include_sections: bool = True):
+        """Apply dictionary to configuration.
+        
+        With include_sections=False the feature sections are left to be built
+        lazily from self._raw.
+        """
+        self._swap_in(self._build_values(data, include_sections))
+    
+    def _build_values(self, data: Dict[str, Any], include_sections: bool = True) -> Dict[str, Any]:
+        """Construct new attribute values from a config dict without touching self.
+        
+        Kept apart from _swap_in so the dataclass construction can run before
+        the lock is taken (see update()).
+        """
+        values: Dict[str, Any] = {}
+        
         # Service instances
-        if 'sonarr_instances' in data:
-            self.sonarr_instances = [
-                ServiceInstance(**inst) for inst in data['sonarr_instances']
-            ]
-        if 'radarr_instances' in data:
-            self.radarr_instances = [
-                ServiceInstance(**inst) for inst in data['radarr_instances']
-            ]
-        if 'sabnzbd_instances' in data:
-            self.sabnzbd_instances = [
-                ServiceInstance(**inst) for inst in data['sabnzbd_instances']
-            ]
+        for attr in ('sonarr_instances', 'radarr_instances', 'sabnzbd_instances'):
+            if attr in data:
+                values[attr] = [ServiceInstance(**inst) for inst in data[attr]]
         
         # Feature configs
-        if 'tiers' in data:
-            tiers_data = data['tiers']
-            self.tiers = TierConfig(
-                hot=TierSettings(**tiers_data.get('hot', {})) if isinstance(tiers_data.get('hot'), dict) else TierSettings(),
-                warm=TierSettings(**tiers_data.get('warm', {})) if isinstance(tiers_data.get('warm'), dict) else TierSettings(),
-                cool=TierSettings(**tiers_data.get('cool', {})) if isinstance(tiers_data.get('cool'), dict) else TierSettings(),
-                cold=TierSettings(**tiers_data.get('cold', {})) if isinstance(tiers_data.get('cold'), dict) else TierSettings(),
-            )
-        if 'auto_resolution' in data:
-            self.auto_resolution = AutoResolutionConfig(**data['auto_resolution'])
-        if 'search' in data:
-            self.search = SearchConfig(**data['search'])
-        if 'email' in data:
-            self.email = EmailConfig(**data['email'])
-        if 'quiet_hours' in data:
-            self.quiet_hours = QuietHoursConfig(**data['quiet_hours'])
-        if 'storage' in data:
-            # Handle paths_to_monitor separately since it's a list
-            storage_data = data['storage'].copy()
-            if 'paths_to_monitor' not in storage_data:
-                storage_data['paths_to_monitor'] = []
-            self.storage = StorageConfig(**storage_data)
+        if include_sections:
+            for key, build in _SECTION_BUILDERS.items():
+                if key in data:
+                    values[key] = build(data[key])
         
         # App settings
-        self.app_name = data.get('app_name', self.app_name)
-        self.setup_complete = data.get('setup_complete', False)
-        self.debug_mode = data.get('debug_mode', False)
+        values['app_name'] = data.get('app_name', self.app_name)
+        values['setup_complete'] = data.get('setup_complete', False)
+        values['debug_mode'] = data.get('debug_mode', False)
+        return values
+    
+    def _swap_in(self, values: Dict[str, Any]):
+        """Publish values built by _build_values - plain attribute stores only."""
+        for name, value in values.items():
+            setattr(self, name, value)
+        self._enabled_cache.clear()
+        self._dirty = True
+    
+    def _build_section(self, name: str, default):
+        """Build a feature section from the loaded file, falling back to defaults.
+        
+        A bad value only costs that field: the rest of the section is kept, so
+        the next save() doesn't overwrite the user's other settings.
+        """
+        if name not in self._raw:
+            return default()
+        build = _SECTION_BUILDERS[name]
+        raw = self._raw[name]
+        try:
+            return build(raw)
+        except Exception as e:
+            print(f"Warning: Could not load config section '{name}': {e}")
+        if not isinstance(raw, dict):
+            return default()
+        
+        kept: Dict[str, Any] = {}
+        for key, value in raw.items():
+            try:
+                build({**kept, key: value})
+            except Exception as e:
+                print(f"Warning: Ignoring config value {name}.{key}: {e}")
+            else:
+                kept[key] = value
+        return build(kept)
+    
+    # Assigning to these (as _apply_dict does) replaces the cached value
+    
+    @cached_property
+    def tiers(self) -> TierConfig:
+        return self._build_section('tiers', TierConfig)
+    
+    @cached_property
+    def auto_resolution(self) -> AutoResolutionConfig:
+        return self._build_section('auto_resolution', AutoResolutionConfig)
+    
+    @cached_property
+    def search(self) -> SearchConfig:
+        return self._build_section('search', SearchConfig)
+    
+    @cached_property
+    def email(self) -> EmailConfig:
+        return self._build_section('email', EmailConfig)
+    
+    @cached_property
+    def quiet_hours(self) -> QuietHoursConfig:
+        return self._build_section('quiet_hours', QuietHoursConfig)
+    
+    @cached_property
+    def storage(self) -> StorageConfig:
+        return self._build_section('storage', StorageConfig)
     
     def _apply_env_vars(self):
         """Apply environment variable overrides."""
         # Support single instance via env vars for backward compatibility
-        sonarr_url = os.environ.get('SONARR_URL')
-        sonarr_key = os.environ.get('SONARR_API_KEY')
-        if sonarr_url and sonarr_key and not self.sonarr_instances:
-            self.sonarr_instances.append(ServiceInstance(
-                name="Sonarr",
-                url=sonarr_url,
-                api_key=sonarr_key,
-                enabled=True
-            ))
+        env = os.environ
+        if not any(key in env for _, url_key, api_key_key, _ in _ENV_INSTANCES
+                   for key in (url_key, api_key_key)):
+            return  # Common case: file-only config
         
-        radarr_url = os.environ.get('RADARR_URL')
-        radarr_key = os.environ.get('RADARR_API_KEY')
-        if radarr_url and radarr_key and not self.radarr_instances:
-            self.radarr_instances.append(ServiceInstance(
-                name="Radarr",
-                url=radarr_url,
-                api_key=radarr_key,
-                enabled=True
-            ))
+        for display_name, url_key, api_key_key, attr in _ENV_INSTANCES:
+            url = env.get(url_key)
+            api_key = env.get(api_key_key)
+            instances = getattr(self, attr)
+            if url and api_key and not instances:
+                instances.append(ServiceInstance(
+                    name=display_name,
+                    url=url,
+                    api_key=api_key,
+                    enabled=True
+                ))
         
-        sabnzbd_url = os.environ.get('SABNZBD_URL')
-        sabnzbd_key = os.environ.get('SABNZBD_API_KEY')
-        if sabnzbd_url and sabnzbd_key and not self.sabnzbd_instances:
-            self.sabnzbd_instances.append(ServiceInstance(
-                name="SABnzbd",
-                url=sabnzbd_url,
-                api_key=sabnzbd_key,
-                enabled=True
-            ))
+        self._enabled_cache.clear()
     
     def save(self):
-        """Save configuration to file."""
+        """Save configuration to file (skipped if the content is unchanged)."""
         with self._lock:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                'sonarr_instances': [asdict(inst) for inst in self.sonarr_instances],
-                'radarr_instances': [asdict(inst) for inst in self.radarr_instances],
-                'sabnzbd_instances': [asdict(inst) for inst in self.sabnzbd_instances],
-                'tiers': asdict(self.tiers),
-                'auto_resolution': asdict(self.auto_resolution),
-                'search': asdict(self.search),
-                'email': asdict(self.email),
-                'quiet_hours': asdict(self.quiet_hours),
-                'storage': asdict(self.storage),
-                'app_name': self.app_name,
-                'setup_complete': self.setup_complete,
-                'debug_mode': self.debug_mode,
-            }
+            # Callers (e.g. the settings API) mutate sections in place and then
+            # save, so always re-snapshot here
+            self._dirty = True
+            data = dict(self._snapshot())
+            data['app_name'] = self.app_name
+            self._save_seq += 1
+            seq = self._save_seq
+        
+        # Encoding and disk I/O happen outside the state lock so readers are
+        # never stuck behind a write
+        with self._save_lock:
+            if seq < self._written_seq:
+                return  # a newer snapshot already reached disk
+            content = _JSON_ENCODER.encode(data)
+            content_hash = hash(content)
+            if content_hash == self._saved_hash and self.config_path.exists():
+                self._written_seq = seq
+                return
             
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, self.config_path)
+            self._saved_hash = content_hash
+            self._written_seq = seq
     
     def update(self, data: Dict[str, Any]):
         """Update configuration from dictionary."""
+        values = self._build_values(data)
         with self._lock:
-            self._apply_dict(data)
+            self._swap_in(values)
         self.save()
     
     def is_configured(self) -> bool:
         """Check if initial setup is complete."""
         return self.setup_complete
     
+    def _get_enabled(self, service: str) -> List[ServiceInstance]:
+        """Valid instances for a service, cached until instances are re-applied."""
+        enabled = self._enabled_cache.get(service)
+        if enabled is None:
+            with self._lock:  # don't repopulate from a list update() just replaced
+                enabled = [i for i in getattr(self, f'{service}_instances') if i.is_valid()]
+                self._enabled_cache[service] = enabled
+        return enabled
+    
     def get_enabled_sonarr(self) -> List[ServiceInstance]:
         """Get list of enabled Sonarr instances."""
-        return [s for s in self.sonarr_instances if s.is_valid()]
+        return self._get_enabled('sonarr')
     
     def get_enabled_radarr(self) -> List[ServiceInstance]:
         """Get list of enabled Radarr instances."""
-        return [r for r in self.radarr_instances if r.is_valid()]
+        return self._get_enabled('radarr')
     
     def get_enabled_sabnzbd(self) -> List[ServiceInstance]:
         """Get list of enabled SABnzbd instances."""
-        return [s for s in self.sabnzbd_instances if s.is_valid()]
+        return self._get_enabled('sabnzbd')
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary (for API/wizard)."""
-        return {
-            'sonarr_instances': [asdict(s) for s in self.sonarr_instances],
-            'radarr_instances': [asdict(r) for r in self.radarr_instances],
-            'sabnzbd_instances': [asdict(s) for s in self.sabnzbd_instances],
-            'tiers': asdict(self.tiers),
-            'auto_resolution': asdict(self.auto_resolution),
-            'search': asdict(self.search),
-            'email': asdict(self.email),
-            'quiet_hours': asdict(self.quiet_hours),
-            'storage': asdict(self.storage),
-            'setup_complete': self.setup_complete,
-            'debug_mode': self.debug_mode,
-        }
+        """Convert configuration to dictionary (for API/wizard).
+        
+        Returns a cached snapshot, rebuilt after update()/save(). Treat it as
+        read-only - it is shared between callers.
+        """
+        with self._lock:
+            return self._snapshot()
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Build (or reuse) the to_dict() snapshot. Caller holds self._lock."""
+        if self._dirty or self._dict_cache is None:
+            self._dict_cache = {
+                'sonarr_instances': [_fast_asdict(s) for s in self.sonarr_instances],
+                'radarr_instances': [_fast_asdict(r) for r in self.radarr_instances],
+                'sabnzbd_instances': [_fast_asdict(s) for s in self.sabnzbd_instances],
+                'tiers': _tiers_asdict(self.tiers),
+                'auto_resolution': _fast_asdict(self.auto_resolution),
+                'search': _fast_asdict(self.search),
+                'email': _fast_asdict(self.email),
+                'quiet_hours': _fast_asdict(self.quiet_hours),
+                'storage': _fast_asdict(self.storage),
+                'setup_complete': self.setup_complete,
+                'debug_mode': self.debug_mode,
+            }
+            self._dirty = False
+        return self._dict_cache
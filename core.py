@@ -3,18 +3,53 @@ Core application for The Fantastic Machinarr.
 Coordinates all components and provides API methods.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from collections import defaultdict, deque
 from datetime import datetime
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, CancelledError, TimeoutError as FutureTimeoutError
+from operator import itemgetter
+import json
 import os
+import shutil
 import threading
+import time
 
 from .config import Config, ServiceInstance
 from .logger import Logger
-from .clients import SonarrClient, RadarrClient, SABnzbdClient
+from .clients import SonarrClient, RadarrClient, SABnzbdClient, APIError
 from .automation import TierManager, QueueMonitor, SmartSearcher, Scheduler, Tier, FindTracker
 from .notifier import EmailNotifier
 from .library import LibraryManager
 
+_GIB = 1 << 30
+
+# Default size of the shared I/O pool; override with MAX_HTTP_CONCURRENCY
+DEFAULT_HTTP_CONCURRENCY = 8
+
+# Seconds get_status waits for connection probes before reporting them down
+CONNECTION_PROBE_TIMEOUT = 5
+
+# Workers reserved for connection probes, so they never queue behind long
+# wanted/* paging on the shared I/O pool
+PROBE_POOL_SIZE = 4
+
+# Seconds test_service waits on a settings-page connection test; the
+# throwaway client's socket timeout is the probe timeout, so this only
+# bounds what that can't (DNS, retries)
+SERVICE_TEST_TIMEOUT = 8
+
+# Queue monitor interval bounds in minutes - the scheduler ticks every 30s,
+# so the minimum can't usefully go lower
+QUEUE_MONITOR_MIN_INTERVAL = 0.5
+QUEUE_MONITOR_MAX_INTERVAL = 5
+
+# While a service is sending webhooks, polling is only a fallback and can
+# back off further; webhooks older than the window no longer count
+QUEUE_MONITOR_WEBHOOK_MAX_INTERVAL = 15
+WEBHOOK_ACTIVE_WINDOW = 3600  # seconds
+
 
 class MachinarrCore:
     """
@@ -69,6 +104,22 @@ class MachinarrCore:
         self.radarr_clients: Dict[str, RadarrClient] = {}
         self.sabnzbd_clients: Dict[str, SABnzbdClient] = {}
         
+        # Shared pool for fanning independent per-instance API calls out in
+        # parallel (status checks, queue polls, missing/cutoff fetches).
+        # Size is tunable with MAX_HTTP_CONCURRENCY for many-instance setups
+        self._io_pool = ThreadPoolExecutor(max_workers=self._http_concurrency(),
+                                           thread_name_prefix='tfm-io')
+        self._probe_pool = ThreadPoolExecutor(max_workers=PROBE_POOL_SIZE,
+                                              thread_name_prefix='tfm-probe')
+        # Sonarr and Radarr queue sweeps run on separate scheduler workers
+        self._queue_monitor_lock = threading.Lock()
+        # source -> {queue_id: instance name} from the latest queue sweep
+        self._queue_owner: Dict[str, Dict[Any, Optional[str]]] = {}
+        # source -> consecutive sweeps that found every queue empty
+        self._queue_idle_sweeps: Dict[str, int] = {}
+        # source -> time.monotonic() of the last webhook it sent
+        self._last_webhook: Dict[str, float] = {}
+        
         # Core components
         self.tier_manager = TierManager(config)      # Classifies content by age
         self.find_tracker = FindTracker(config, logger, config.data_dir)  # Track successful finds
@@ -79,8 +130,11 @@ class MachinarrCore:
         self.notifier = EmailNotifier(config, logger)
         
         # Legacy find tracking (deprecated - use find_tracker instead)
-        self.recent_finds: List[Dict] = []
         self.max_finds_history = 100
+        # Bounded: appends past max_finds_history drop the oldest in O(1)
+        self.recent_finds: deque = deque(maxlen=self.max_finds_history)
+        # Per-source counts over recent_finds, maintained on append/evict
+        self._finds_by_source = {'sonarr': 0, 'radarr': 0}
         self._load_finds()  # Load persisted finds
         
         # Auto-tuning metrics (track API response times)
@@ -90,11 +144,45 @@ class MachinarrCore:
             'samples': 0,
         }
         
+        # Short-lived cache for _get_all_missing so back-to-back UI calls don't
+        # repeat the full fan-out. (include_items, limit) -> (monotonic ts, result)
+        self._missing_cache: Dict[Tuple[bool, int], Tuple[float, Dict[str, Any]]] = {}
+        self._missing_cache_ttl = 15.0  # seconds
+        # Single-flight for _get_all_missing: key -> Event set when the one
+        # fetch in progress for it finishes. The generation is bumped by
+        # invalidate_missing_cache so a fetch that started before an
+        # invalidation doesn't store its result
+        self._missing_lock = threading.Lock()
+        self._missing_inflight: Dict[Tuple[bool, int], threading.Event] = {}
+        self._missing_generation = 0
+        # (missing_data, response) from the last get_missing_items; reused
+        # while _get_all_missing keeps returning the same cached object
+        self._missing_items_memo: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        
+        # test_connection results for get_status, so dashboards polling /status
+        # don't probe every back-end on each request. key -> (monotonic ts, result)
+        self._conn_probe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._conn_probe_ttl = 30.0  # seconds
+        # key -> (client, probe copy of it with a CONNECTION_PROBE_TIMEOUT socket
+        # timeout), so a probe that outlives get_status's wait frees its pool
+        # worker in seconds instead of after the client's 120s timeout
+        self._probe_clients: Dict[str, Tuple[Any, Any]] = {}
+        
+        # Root folder lists for get_storage_info. (label, name) -> (monotonic ts, folders)
+        self._root_folder_cache: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
+        self._root_folder_ttl = 300.0  # seconds
+        # Sonarr episode lookups for intervention actions ("open in Sonarr"
+        # then "delete" resolve the same seriesId). (instance, episode id) ->
+        # (monotonic ts, episode)
+        self._episode_cache: Dict[Tuple[str, Any], Tuple[float, Dict]] = {}
+        self._episode_ttl = 30.0  # seconds
+        
         # Cache for tier data - TTL now comes from library manager
         self._tier_cache = None
         self._tier_cache_time = None
         
         # Progressive loading state
+        self._progressive_start_lock = threading.Lock()
         self._progressive_loading = False
         self._progressive_stage = ''
         self._progressive_counts = {
@@ -153,9 +241,8 @@ class MachinarrCore:
         self._refresh_queue_status()
         
         # 3. Update activity state
-        with self._activity_lock:
-            self._activity_state['detail'] = f"Library updated ({change_type})"
-            self._activity_state['updated'] = datetime.now().isoformat()
+        self._update_activity(detail=f"Library updated ({change_type})",
+                              updated=datetime.now().isoformat())
     
     def _refresh_queue_status(self):
         """
@@ -164,53 +251,39 @@ class MachinarrCore:
         Called when library changes to sync Download Problems and Needs Attention panels.
         """
         try:
-            # Gather current queue IDs from all services
-            current_queue_ids = {'sonarr': set(), 'radarr': set()}
+            # Fetch every instance's queue and first page of missing items at
+            # once. Cleanup drops anything not seen, so skip it if any fetch
+            # failed rather than treat that instance's items as gone
+            jobs = []
+            for source, clients in self._arr_sources():
+                get_missing = 'get_missing_episodes' if source == 'sonarr' else 'get_missing_movies'
+                for name, client in clients.items():
+                    jobs.append(((source, 'queue', name), client.get_queue))
+                    jobs.append(((source, 'missing', name),
+                                 partial(getattr(client, get_missing), page=1, page_size=1000)))
             
-            for name, client in self.sonarr_clients.items():
-                try:
-                    queue = client.get_queue()
-                    records = queue.get('records', [])
-                    for item in records:
-                        current_queue_ids['sonarr'].add(item.get('id'))
-                except Exception as e:
-                    self.log.debug(f"Could not get Sonarr queue from {name}: {e}")
+            current_queue_ids = {'sonarr': set(), 'radarr': set()}
+            still_missing_ids = {'sonarr': set(), 'radarr': set()}
+            complete = True
+            for (source, kind, name), records, error in self._fan_out(jobs):
+                if error:
+                    self.log.debug("Could not get %s %s from %s: %s", source.capitalize(), kind, name, error)
+                    complete = False
+                elif kind == 'queue':
+                    current_queue_ids[source].update(item.get('id') for item in records)
+                else:
+                    # Interventions use the series ID for episodes
+                    id_field = 'seriesId' if source == 'sonarr' else 'id'
+                    still_missing_ids[source].update(record.get(id_field) for record in records)
             
-            for name, client in self.radarr_clients.items():
-                try:
-                    queue = client.get_queue()
-                    records = queue.get('records', [])
-                    for item in records:
-                        current_queue_ids['radarr'].add(item.get('id'))
-                except Exception as e:
-                    self.log.debug(f"Could not get Radarr queue from {name}: {e}")
+            if not complete:
+                return
             
             # Clean up stuck items no longer in queue
             resolved_queue = self.queue_monitor.cleanup_resolved_items(current_queue_ids)
             if resolved_queue:
                 self.log.info(f"Cleaned up {resolved_queue} resolved queue items")
             
-            # Gather current missing IDs for intervention cleanup
-            still_missing_ids = {'sonarr': set(), 'radarr': set()}
-            
-            for name, client in self.sonarr_clients.items():
-                try:
-                    # Get missing episode IDs
-                    missing = client.get_missing(page_size=1000)
-                    for record in missing.get('records', []):
-                        # Use series ID for interventions
-                        still_missing_ids['sonarr'].add(record.get('seriesId'))
-                except Exception as e:
-                    self.log.debug(f"Could not get Sonarr missing from {name}: {e}")
-            
-            for name, client in self.radarr_clients.items():
-                try:
-                    missing = client.get_missing(page_size=1000)
-                    for record in missing.get('records', []):
-                        still_missing_ids['radarr'].add(record.get('id'))
-                except Exception as e:
-                    self.log.debug(f"Could not get Radarr missing from {name}: {e}")
-            
             # Clean up interventions for items no longer missing
             resolved_missing = self.queue_monitor.cleanup_missing_interventions(still_missing_ids)
             if resolved_missing:
@@ -221,50 +294,78 @@ class MachinarrCore:
     
     def reinit_clients(self):
         """Initialize or reinitialize API clients."""
-        self.sonarr_clients.clear()
-        self.radarr_clients.clear()
-        self.sabnzbd_clients.clear()
-        
-        for inst in self.config.get_enabled_sonarr():
-            self.sonarr_clients[inst.name] = SonarrClient(
-                inst.url, inst.api_key, inst.name
-            )
-            self.log.info(f"Initialized Sonarr: {inst.name}")
-        
-        for inst in self.config.get_enabled_radarr():
-            self.radarr_clients[inst.name] = RadarrClient(
-                inst.url, inst.api_key, inst.name
-            )
-            self.log.info(f"Initialized Radarr: {inst.name}")
+        self.invalidate_missing_cache()
+        self._conn_probe_cache.clear()
+        self._probe_clients.clear()
+        self._root_folder_cache.clear()
+        self._episode_cache.clear()
+        self._sync_clients(self.sonarr_clients, self.config.get_enabled_sonarr(), SonarrClient, 'Sonarr')
+        self._sync_clients(self.radarr_clients, self.config.get_enabled_radarr(), RadarrClient, 'Radarr')
+        self._sync_clients(self.sabnzbd_clients, self.config.get_enabled_sabnzbd(), SABnzbdClient, 'SABnzbd')
+    
+    def _arr_sources(self) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+        """(source, clients) for each *arr service, in display order."""
+        return (('sonarr', self.sonarr_clients), ('radarr', self.radarr_clients))
+    
+    def _arr_clients(self, source: str) -> Optional[Dict[str, Any]]:
+        """The client map for 'sonarr'/'radarr', or None for anything else."""
+        if source == 'sonarr':
+            return self.sonarr_clients
+        if source == 'radarr':
+            return self.radarr_clients
+        return None
+    
+    def _sync_clients(self, clients: Dict[str, Any], instances: List[ServiceInstance],
+                      client_cls: type, label: str):
+        """
+        Bring a client map in line with the enabled instances.
         
-        for inst in self.config.get_enabled_sabnzbd():
-            self.sabnzbd_clients[inst.name] = SABnzbdClient(
-                inst.url, inst.api_key, inst.name
-            )
-            self.log.info(f"Initialized SABnzbd: {inst.name}")
+        A client whose URL and API key haven't changed is kept as-is, along
+        with its open keep-alive connections and ETag cache - settings saves
+        call reinit_clients, and most of them don't touch the instances.
+        The map is updated in place since other components hold it.
+        """
+        fresh = {}
+        for inst in instances:
+            client = clients.get(inst.name)
+            if (client is None or client.base_url != inst.url.rstrip('/')
+                    or client.api_key != inst.api_key):
+                client = client_cls(inst.url, inst.api_key, inst.name)
+                self.log.info(f"Initialized {label}: {inst.name}")
+            fresh[inst.name] = client
+        clients.clear()
+        clients.update(fresh)
     
     def set_activity(self, status: str, message: str, detail: str = '', search_result: Dict = None):
         """Set global activity state (thread-safe)."""
+        state = {
+            'status': status,
+            'message': message,
+            'detail': detail,
+            'updated': datetime.now().isoformat(),
+            'last_search_result': search_result,
+        }
         with self._activity_lock:
-            self._activity_state = {
-                'status': status,
-                'message': message,
-                'detail': detail,
-                'updated': datetime.now().isoformat(),
-                'last_search_result': search_result or self._activity_state.get('last_search_result')
-            }
+            if not search_result:
+                state['last_search_result'] = self._activity_state.get('last_search_result')
+            self._activity_state = state
+    
+    def _update_activity(self, **fields):
+        """Replace some fields of the activity state (thread-safe)."""
+        with self._activity_lock:
+            self._activity_state = {**self._activity_state, **fields}
     
     def get_activity(self) -> Dict[str, Any]:
         """Get global activity state with scheduler info (thread-safe)."""
-        with self._activity_lock:
-            activity = self._activity_state.copy()
+        # Writers swap in a new dict rather than mutating the published one,
+        # so dashboard polls can copy it without taking the lock
+        activity = dict(self._activity_state)
         
         # Add scheduler info for "next run" display
-        if hasattr(self, 'scheduler') and self.scheduler:
-            for task in self.scheduler.tasks.values():
-                if task.name == 'search_cycle' and task.next_run:
-                    activity['next_search'] = task.next_run.isoformat()
-                    break
+        if self.scheduler is not None:
+            task = self.scheduler.tasks.get('search_cycle')
+            if task and task.next_run:
+                activity['next_search'] = task.next_run.isoformat()
         
         return activity
     
@@ -272,25 +373,43 @@ class MachinarrCore:
         """Start background tasks."""
         search_interval = self.config.search.cycle_interval_minutes
         
+        # Each task names the resource it mostly waits on so the scheduler runs
+        # it on that resource's worker - a long Sonarr sweep can't hold up the
+        # Radarr sweep or the search cycle
         self.scheduler.register_task(
             'search_cycle',
             self._task_search_cycle,
             search_interval,
-            self.config.search.enabled
+            self.config.search.enabled,
+            resource='search'
         )
         
+        # Queue monitors start at the fastest interval and adapt from there
+        # (see _adapt_queue_monitor_interval)
         self.scheduler.register_task(
-            'queue_monitor',
-            self._task_queue_monitor,
-            5,  # Check every 5 minutes
-            True
+            'queue_monitor_sonarr',
+            self._task_queue_monitor_sonarr,
+            QUEUE_MONITOR_MIN_INTERVAL,
+            True,
+            resource='sonarr_http',
+            priority=1
+        )
+        
+        self.scheduler.register_task(
+            'queue_monitor_radarr',
+            self._task_queue_monitor_radarr,
+            QUEUE_MONITOR_MIN_INTERVAL,
+            True,
+            resource='radarr_http',
+            priority=1
         )
         
         self.scheduler.register_task(
             'flush_notifications',
             self._task_flush_notifications,
             self.config.email.batch_interval_minutes,
-            self.config.email.enabled
+            self.config.email.enabled,
+            resource='email'
         )
         
         self.scheduler.start()
@@ -299,6 +418,9 @@ class MachinarrCore:
         """Periodic search task with tag-based find detection."""
         if not self.config.search.enabled:
             return
+        if not self.sonarr_clients and not self.radarr_clients:
+            # Nothing configured yet - don't flip the activity bar or sleep
+            return
         
         self.set_activity('searching', 'Running scheduled search', 'Searching for missing content and upgrades...')
         
@@ -311,28 +433,25 @@ class MachinarrCore:
             self.sonarr_clients, self.radarr_clients,
             progress_callback=on_progress
         )
+        self.invalidate_missing_cache()
         
         searched = result.get('searched', 0)
         successful = result.get('successful', 0)
         
         # STEP 2: Wait briefly for Sonarr/Radarr to process search commands
-        import time
         time.sleep(5)  # Give arr services time to grab
         
-        # STEP 3: Check queues for items with TFM tags (tracks pending finds)
-        for name, client in self.sonarr_clients.items():
+        # STEP 3: Check queues for items with TFM tags (tracks pending finds);
+        # the queues are fetched concurrently, then checked in order
+        jobs = [((source, name, client), client.get_queue)
+                for source, clients in self._arr_sources() for name, client in clients.items()]
+        for (source, name, client), queue, error in self._fan_out(jobs):
             try:
-                queue = client.get_queue()
-                self.find_tracker.check_queue_for_finds(queue, 'sonarr', name, client)
+                if error:
+                    raise error
+                self.find_tracker.check_queue_for_finds(queue, source, name, client)
             except Exception as e:
-                self.log.debug(f"Could not check Sonarr ({name}) queue for finds: {e}")
-        
-        for name, client in self.radarr_clients.items():
-            try:
-                queue = client.get_queue()
-                self.find_tracker.check_queue_for_finds(queue, 'radarr', name, client)
-            except Exception as e:
-                self.log.debug(f"Could not check Radarr ({name}) queue for finds: {e}")
+                self.log.debug("Could not check %s (%s) queue for finds: %s", source.capitalize(), name, e)
         
         # STEP 4: Verify any completed finds (check if files imported)
         new_finds = []
@@ -341,24 +460,24 @@ class MachinarrCore:
                 finds = self.find_tracker.verify_completed_finds('sonarr', name, client)
                 new_finds.extend(finds)
             except Exception as e:
-                self.log.debug(f"Could not verify Sonarr ({name}) finds: {e}")
+                self.log.debug("Could not verify Sonarr (%s) finds: %s", name, e)
         
         for name, client in self.radarr_clients.items():
             try:
                 finds = self.find_tracker.verify_completed_finds('radarr', name, client)
                 new_finds.extend(finds)
             except Exception as e:
-                self.log.debug(f"Could not verify Radarr ({name}) finds: {e}")
+                self.log.debug("Could not verify Radarr (%s) finds: %s", name, e)
         
         # STEP 5: Cleanup old tracked searches
         try:
             self.find_tracker.cleanup_old_searches(max_age_hours=2)
         except Exception as e:
-            self.log.debug(f"Could not cleanup old searches: {e}")
+            self.log.debug("Could not cleanup old searches: %s", e)
         
-        # Notify for each find
-        for find in new_finds:
-            self.notifier.notify_find(find.title, find.source, find.tier)
+        # Notify for all finds at once
+        if new_finds:
+            self.notifier.notify_finds((f.title, f.source, f.tier) for f in new_finds)
         
         # Update activity with find count
         finds_msg = f", {len(new_finds)} finds!" if new_finds else ""
@@ -367,91 +486,213 @@ class MachinarrCore:
         else:
             self.set_activity('idle', 'Search complete', f'No items needed searching{finds_msg}', search_result=result)
         
-        self.log.info(f"Search cycle: {searched} items searched")
+        self.log.info("Search cycle: %s items searched", searched)
     
-    def _task_queue_monitor(self):
-        """Monitor queues for stuck items and detect finds in real-time."""
-        # Check Sonarr queues
-        for name, client in self.sonarr_clients.items():
-            try:
-                queue = client.get_queue()
-                
-                # Check for stuck items
-                for item in queue:
-                    stuck = self.queue_monitor.analyze_queue_item(
-                        item, 'sonarr', name, client
-                    )
-                    if stuck and self.queue_monitor.should_auto_resolve(stuck):
-                        self.queue_monitor.resolve_stuck_item(stuck, client)
-                
-                # Check for new grabs (items from TFM-tagged series) - adds to pending
-                self.find_tracker.check_queue_for_finds(queue, 'sonarr', name, client)
-                
-                # Verify pending finds (check if files actually imported)
-                confirmed_finds = self.find_tracker.verify_completed_finds('sonarr', name, client)
-                for find in confirmed_finds:
-                    self.notifier.notify_find(find.title, find.source, find.tier)
-                    
-            except Exception as e:
-                self.log.error(f"Queue monitor error ({name}): {e}")
+    def _task_queue_monitor_sonarr(self):
+        """Monitor Sonarr queues for stuck items and finds."""
+        self._monitor_queues('sonarr', self.sonarr_clients)
+    
+    def _task_queue_monitor_radarr(self):
+        """Monitor Radarr queues for stuck items and finds."""
+        self._monitor_queues('radarr', self.radarr_clients)
+    
+    def _monitor_queues(self, source: str, clients: Dict[str, Any]):
+        """Check one service's queues for stuck items and detect finds."""
+        if not clients:
+            return
         
-        # Check Radarr queues
-        for name, client in self.radarr_clients.items():
+        # Fetch every instance's queue concurrently; analysis below stays
+        # sequential since the monitor keeps shared state (and the other
+        # service's sweep may be running on its own worker)
+        instances = list(clients.items())
+        queues = self._fan_out([(inst, inst[1].get_queue) for inst in instances])
+        
+        # queue_id -> owning instance for resolve_item; an id seen on two
+        # instances is ambiguous (None) and resolves by trying each
+        owners: Dict[Any, Optional[str]] = {}
+        for (name, _), queue, error in queues:
+            for item in queue or []:
+                queue_id = item.get('id')
+                owners[queue_id] = None if owners.get(queue_id, name) != name else name
+        self._queue_owner[source] = owners
+        self._adapt_queue_monitor_interval(source, busy=bool(owners))
+        
+        analyze = self.queue_monitor.analyze_queue_item
+        should_resolve = self.queue_monitor.should_auto_resolve
+        for (name, client), queue, error in queues:
+            item = None
             try:
-                queue = client.get_queue()
+                if error:
+                    raise error
                 
-                # Check for stuck items
-                for item in queue:
-                    stuck = self.queue_monitor.analyze_queue_item(
-                        item, 'radarr', name, client
-                    )
-                    if stuck and self.queue_monitor.should_auto_resolve(stuck):
-                        self.queue_monitor.resolve_stuck_item(stuck, client)
+                # Check for stuck items; anything due for auto-resolution is
+                # removed with one bulk request instead of one per item
+                with self._queue_monitor_lock:
+                    due = []
+                    for item in queue:
+                        stuck = analyze(item, source, name, client)
+                        if stuck and should_resolve(stuck):
+                            due.append(stuck)
+                    item = None
+                    if due:
+                        self.queue_monitor.resolve_stuck_items(due, client)
                 
-                # Check for new grabs (items from TFM-tagged movies) - adds to pending
-                self.find_tracker.check_queue_for_finds(queue, 'radarr', name, client)
+                # Check for new grabs (items from TFM-tagged series/movies) - adds to pending
+                self.find_tracker.check_queue_for_finds(queue, source, name, client)
                 
                 # Verify pending finds (check if files actually imported)
-                confirmed_finds = self.find_tracker.verify_completed_finds('radarr', name, client)
-                for find in confirmed_finds:
-                    self.notifier.notify_find(find.title, find.source, find.tier)
+                confirmed_finds = self.find_tracker.verify_completed_finds(source, name, client)
+                if confirmed_finds:
+                    self.notifier.notify_finds((f.title, f.source, f.tier) for f in confirmed_finds)
                     
             except Exception as e:
-                self.log.error(f"Queue monitor error ({name}): {e}")
+                if item is not None:
+                    self.log.error("Queue monitor error (%s, queue item %s): %s", name, item.get('id'), e)
+                else:
+                    self.log.error("Queue monitor error (%s): %s", name, e)
+    
+    def _adapt_queue_monitor_interval(self, source: str, busy: bool):
+        """
+        Poll a service's queues often while it has downloads, back off when idle.
+        
+        Any queued item resets the interval to QUEUE_MONITOR_MIN_INTERVAL; each
+        empty sweep doubles it, up to QUEUE_MONITOR_MAX_INTERVAL (or
+        QUEUE_MONITOR_WEBHOOK_MAX_INTERVAL while the service sends webhooks).
+        """
+        idle = 0 if busy else self._queue_idle_sweeps.get(source, 0) + 1
+        self._queue_idle_sweeps[source] = idle
+        max_interval = QUEUE_MONITOR_MAX_INTERVAL
+        last_webhook = self._last_webhook.get(source)
+        if last_webhook and time.monotonic() - last_webhook < WEBHOOK_ACTIVE_WINDOW:
+            max_interval = QUEUE_MONITOR_WEBHOOK_MAX_INTERVAL
+        interval = min(max_interval, QUEUE_MONITOR_MIN_INTERVAL * 2 ** min(idle, 5))
+        self.scheduler.set_interval(f'queue_monitor_{source}', interval)
+    
+    def handle_webhook(self, source: str, payload: Dict) -> Dict[str, Any]:
+        """
+        Handle a Sonarr/Radarr Connect webhook or a SABnzbd notification.
+        
+        Grabs, imports and download-client events make the matching queue
+        monitor run on the next scheduler wake-up instead of waiting for its
+        poll; SABnzbd doesn't say which service a download belongs to, so it
+        wakes both.
+        """
+        if source in ('sonarr', 'radarr'):
+            sources = [source]
+        elif source == 'sabnzbd':
+            sources = ['sonarr', 'radarr']
+        else:
+            return {'success': False, 'message': f'Unknown source: {source}'}
+        
+        event = payload.get('eventType', 'unknown')
+        self.log.debug("Webhook from %s: %s", source, event)
+        if event == 'Test':
+            return {'success': True, 'message': 'Webhook received'}
+        
+        now = time.monotonic()
+        for src in sources:
+            self._last_webhook[src] = now
+            self._queue_idle_sweeps[src] = 0
+            self.scheduler.request_run(f'queue_monitor_{src}')
+        if event == 'Download':
+            # An import changes what's missing
+            self.invalidate_missing_cache()
+        return {'success': True, 'message': f'Queue check scheduled for {", ".join(sources)}'}
     
     def _task_flush_notifications(self):
         """Flush batched notifications."""
         self.notifier.flush_finds()
     
+    def _http_concurrency(self) -> int:
+        """Worker count for the I/O pool from MAX_HTTP_CONCURRENCY (default 8)."""
+        value = os.environ.get('MAX_HTTP_CONCURRENCY')
+        if not value:
+            return DEFAULT_HTTP_CONCURRENCY
+        try:
+            return max(1, int(value))
+        except ValueError:
+            self.log.warning("Ignoring invalid MAX_HTTP_CONCURRENCY=%r, using %d",
+                             value, DEFAULT_HTTP_CONCURRENCY)
+            return DEFAULT_HTTP_CONCURRENCY
+    
+    def _fan_out(self, jobs: List[Tuple[Any, Callable[[], Any]]],
+                 timeout: Optional[float] = None,
+                 pool: Optional[ThreadPoolExecutor] = None) -> List[Tuple[Any, Any, Optional[Exception]]]:
+        """
+        Run independent client calls concurrently on the shared I/O pool (or pool).
+        
+        Takes (key, zero-arg callable) pairs and returns (key, result, error)
+        in the same order. A failing call reports its exception instead of
+        raising, so one unreachable instance doesn't hold up or sink the rest.
+        Wall time becomes the slowest call rather than the sum of them.
+        
+        With a timeout (seconds, for the whole batch), calls still running at
+        the deadline report a TimeoutError; they finish in the background.
+        Calls that never got a worker are cancelled and report CancelledError.
+        """
+        pool = pool or self._io_pool
+        futures = [(key, pool.submit(fn)) for key, fn in jobs]
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        results = []
+        for key, future in futures:
+            try:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                results.append((key, future.result(remaining), None))
+            except FutureTimeoutError:
+                if future.cancel():
+                    error = CancelledError(f"Not started within {timeout:g}s")
+                else:
+                    error = TimeoutError(f"No response within {timeout:g}s")
+                results.append((key, None, error))
+            except Exception as e:
+                results.append((key, None, e))
+        return results
+    
     # ============ API Methods ============
     
     def get_status(self) -> Dict[str, Any]:
         """Get overall system status."""
         services = {}
         
-        for name, client in self.sonarr_clients.items():
-            result = client.test_connection()
-            services[f"sonarr_{name}"] = {
-                'name': name,
-                'type': 'sonarr',
-                'connected': result['success'],
-                'message': result['message']
-            }
-        
-        for name, client in self.radarr_clients.items():
-            result = client.test_connection()
-            services[f"radarr_{name}"] = {
-                'name': name,
-                'type': 'radarr',
-                'connected': result['success'],
-                'message': result['message']
-            }
-        
-        for name, client in self.sabnzbd_clients.items():
-            result = client.test_connection()
-            services[f"sabnzbd_{name}"] = {
+        # Probe every instance whose last result has gone stale at once -
+        # test_connection reports its own errors
+        now = time.monotonic()
+        order = []
+        probes = {}
+        jobs = []
+        for service_type, clients in (*self._arr_sources(), ('sabnzbd', self.sabnzbd_clients)):
+            for name, client in clients.items():
+                key = f"{service_type}_{name}"
+                order.append(key)
+                cached = self._conn_probe_cache.get(key)
+                if cached and now - cached[0] < self._conn_probe_ttl:
+                    probes[key] = (service_type, name, cached[1])
+                else:
+                    jobs.append(((service_type, name), self._probe_client(key, client).test_connection))
+        
+        # A hung instance shouldn't hold /api/status for the client's full
+        # request timeout; it's reported as down (and cached like any other
+        # result, so polls don't pile more probes onto it)
+        for (service_type, name), result, error in self._fan_out(jobs, timeout=CONNECTION_PROBE_TIMEOUT,
+                                                                 pool=self._probe_pool):
+            key = f"{service_type}_{name}"
+            if isinstance(error, CancelledError):
+                # Never got a worker - says nothing about the instance, so
+                # show the last known result and probe again next poll
+                cached = self._conn_probe_cache.get(key)
+                result = cached[1] if cached else {'success': False, 'message': 'Connection check pending'}
+                probes[key] = (service_type, name, result)
+                continue
+            if error:
+                result = {'success': False, 'message': str(error)}
+            self._conn_probe_cache[key] = (time.monotonic(), result)
+            probes[key] = (service_type, name, result)
+        
+        for key in order:
+            service_type, name, result = probes[key]
+            services[key] = {
                 'name': name,
-                'type': 'sabnzbd',
+                'type': service_type,
                 'connected': result['success'],
                 'message': result['message']
             }
@@ -463,6 +704,16 @@ class MachinarrCore:
             'queue_monitor': self.queue_monitor.get_stats(),
         }
     
+    def _probe_client(self, key: str, client):
+        """Short-timeout copy of client for connection probes, rebuilt if the client is replaced."""
+        cached = self._probe_clients.get(key)
+        if cached and cached[0] is client:
+            return cached[1]
+        probe = type(client)(client.base_url, client.api_key, client.name)
+        probe.timeout = CONNECTION_PROBE_TIMEOUT
+        self._probe_clients[key] = (client, probe)
+        return probe
+    
     def get_quick_counts(self) -> Dict[str, Any]:
         """Get just the item counts quickly (no tier classification)."""
         counts = {
@@ -472,30 +723,17 @@ class MachinarrCore:
             'radarr_upgrade': 0,
         }
         
-        # Just count items - no classification
-        for name, client in self.sonarr_clients.items():
-            try:
-                missing = client.get_missing_episodes()
-                counts['sonarr_missing'] += len(missing)
-            except:
-                pass
-            try:
-                upgrades = client.get_cutoff_unmet()
-                counts['sonarr_upgrade'] += len(upgrades)
-            except:
-                pass
+        # Just count items - no classification. totalRecords from a one-record
+        # page is enough, so nothing but the counts is downloaded
+        jobs = []
+        for source, clients in self._arr_sources():
+            for client in clients.values():
+                jobs.append((f'{source}_missing', client.get_missing_count))
+                jobs.append((f'{source}_upgrade', client.get_cutoff_unmet_count))
         
-        for name, client in self.radarr_clients.items():
-            try:
-                missing = client.get_missing_movies()
-                counts['radarr_missing'] += len(missing)
-            except:
-                pass
-            try:
-                upgrades = client.get_cutoff_unmet()
-                counts['radarr_upgrade'] += len(upgrades)
-            except:
-                pass
+        for key, total, error in self._fan_out(jobs):
+            if not error:
+                counts[key] += total
         
         total = counts['sonarr_missing'] + counts['radarr_missing']
         return {
@@ -567,7 +805,6 @@ class MachinarrCore:
         self._start_progressive_load()
         
         # Wait for it to complete (with timeout and abort check)
-        import time
         timeout = 60  # 60 seconds max
         start = time.time()
         while self._progressive_loading and (time.time() - start) < timeout:
@@ -597,28 +834,17 @@ class MachinarrCore:
     
     def get_scoreboard_quick(self) -> Dict[str, Any]:
         """Get just scoreboard data quickly (no tier classification)."""
-        finds_by_source = {'sonarr': 0, 'radarr': 0}
-        for find in self.recent_finds:
-            source = find.get('source', '').lower()
-            if source in finds_by_source:
-                finds_by_source[source] += 1
-        
-        scheduler_info = None
-        if hasattr(self, 'scheduler') and self.scheduler:
-            scheduler_info = {
-                'tasks': [t.to_dict() for t in self.scheduler.tasks.values()]
-            }
+        finds_by_source = dict(self._finds_by_source)
         
-        # Check if we have recent tier data cached (ready to display)
-        has_cached_data = (
-            self._tier_cache is not None and 
-            self._tier_cache_time is not None
-        )
+        scheduler_info = {'tasks': self.scheduler.get_task_dicts()}
+        
+        # Check if we have recent tier data cached (ready to display); read
+        # the timestamp once - a background catalog load may replace it
+        cache_time = self._tier_cache_time
+        has_cached_data = self._tier_cache is not None and cache_time is not None
         
         # Calculate cache age in seconds
-        cache_age = None
-        if self._tier_cache_time:
-            cache_age = (datetime.now() - self._tier_cache_time).total_seconds()
+        cache_age = (datetime.now() - cache_time).total_seconds() if cache_time else None
         
         # Get find stats from FindTracker (primary) or fall back to searcher
         find_stats = self.find_tracker.get_stats()
@@ -642,14 +868,17 @@ class MachinarrCore:
             'activity': self.get_activity(),  # Global activity state
         }
     
-    def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get data for dashboard display."""
-        # Scoreboard with finds breakdown
-        finds_by_source = {'sonarr': 0, 'radarr': 0}
-        for find in self.recent_finds:
-            source = find.get('source', '').lower()
-            if source in finds_by_source:
-                finds_by_source[source] += 1
+    def get_dashboard_data(self, stuck: Optional[List] = None,
+                           interventions: Optional[List] = None) -> Dict[str, Any]:
+        """Get data for dashboard display.
+        
+        stuck/interventions may be passed in when the caller already fetched
+        them from the queue monitor (see get_overview).
+        """
+        if stuck is None:
+            stuck = self.queue_monitor.get_stuck_items()
+        if interventions is None:
+            interventions = self.queue_monitor.get_pending_interventions()
         
         # Check cache for tier data - TTL from library manager
         now = datetime.now()
@@ -706,17 +935,13 @@ class MachinarrCore:
         tier_stats['total_upgrades'] = missing_data['total_upgrades']
         
         # Scheduler info
-        scheduler_info = None
-        if hasattr(self, 'scheduler') and self.scheduler:
-            scheduler_info = {
-                'tasks': [t.to_dict() for t in self.scheduler.tasks.values()]
-            }
+        scheduler_info = {'tasks': self.scheduler.get_task_dicts()}
         
         return {
             'scoreboard': scoreboard,
             'tiers': tier_stats,
-            'stuck_count': len(self.queue_monitor.get_stuck_items()),
-            'intervention_count': len(self.queue_monitor.get_pending_interventions()),
+            'stuck_count': len(stuck),
+            'intervention_count': len(interventions),
             'scheduler': scheduler_info,
             'loading': self._progressive_loading,
             'loading_stage': self._progressive_stage,
@@ -812,7 +1037,6 @@ class MachinarrCore:
         Partial data is still useful - shows progress and avoids starting from zero.
         """
         try:
-            import json
             cache_path = self.config.data_dir / 'catalog_cache.json'
             
             if not cache_path.exists():
@@ -879,17 +1103,15 @@ class MachinarrCore:
         
         PERSISTENCE: Saves progress every 30 seconds, so restarts don't lose work.
         """
-        import threading
-        from concurrent.futures import ThreadPoolExecutor
         import queue
-        import time
         
-        if self._progressive_loading:
-            return  # Already loading
-        
-        self._progressive_loading = True
-        self._init_progressive_state()
-        self._progressive_loading = True  # Re-set after init
+        # Concurrent dashboard polls can all find the cache stale - only the
+        # first one starts a load
+        with self._progressive_start_lock:
+            if self._progressive_loading:
+                return  # Already loading
+            self._init_progressive_state()
+            self._progressive_loading = True
         
         # Lock for thread-safe counter updates
         self._progress_lock = threading.Lock()
@@ -1027,7 +1249,7 @@ class MachinarrCore:
                                 if series_id and series_id not in series_cache:
                                     try:
                                         series_cache[series_id] = client.get_series_by_id(series_id)
-                                    except:
+                                    except APIError:
                                         series_cache[series_id] = {}
                                 
                                 item = self.tier_manager.classify_episode(
@@ -1069,7 +1291,7 @@ class MachinarrCore:
                                 if series_id and series_id not in series_cache:
                                     try:
                                         series_cache[series_id] = client.get_series_by_id(series_id)
-                                    except:
+                                    except APIError:
                                         series_cache[series_id] = {}
                                 
                                 item = self.tier_manager.classify_episode(
@@ -1215,8 +1437,8 @@ class MachinarrCore:
                     self._tier_cache_time = datetime.now()
                     self._save_catalog_cache()
                     self.log.info("Saved partial catalog progress before error")
-                except:
-                    pass
+                except Exception as save_error:
+                    self.log.debug("Could not save partial catalog progress: %s", save_error)
                 self.set_activity('idle', 'Error', str(e))
             finally:
                 self._progressive_loading = False
@@ -1226,14 +1448,76 @@ class MachinarrCore:
         thread = threading.Thread(target=load_progressively, daemon=True)
         thread.start()
     
+    def invalidate_missing_cache(self):
+        """Drop cached _get_all_missing results (clients or finds changed)."""
+        with self._missing_lock:
+            self._missing_cache.clear()
+            self._missing_generation += 1
+    
     def _get_all_missing(self, include_items: bool = True, limit_per_instance: int = 100) -> Dict[str, Any]:
         """Get all missing items AND upgrades from all instances.
         
+        Results are reused for _missing_cache_ttl seconds; treat them as read-only.
+        Concurrent callers share one fetch, and a result up to twice the TTL
+        old is returned at once while a background thread refreshes it.
+        
         Returns dict with:
         - items: List of TieredItem (limited for display)
         - counts: True counts by source and type
         - tier_counts: True counts by tier and source
         """
+        key = (include_items, limit_per_instance)
+        ttl = self._missing_cache_ttl
+        while True:
+            with self._missing_lock:
+                cached = self._missing_cache.get(key)
+                age = time.monotonic() - cached[0] if cached else None
+                if cached and age < ttl:
+                    return cached[1]
+                usable = cached is not None and age < 2 * ttl
+                
+                event = self._missing_inflight.get(key)
+                if event is None:
+                    event = self._missing_inflight[key] = threading.Event()
+                    generation = self._missing_generation
+                    if not usable:
+                        break  # fetch it on this thread
+                    threading.Thread(target=self._refresh_missing,
+                                     args=(key, event, generation, True), daemon=True).start()
+                    return cached[1]
+                if usable:
+                    return cached[1]
+            # Someone else is fetching - wait for it, then look again (a failed
+            # or invalidated fetch leaves nothing cached and we fetch ourselves)
+            event.wait()
+        
+        return self._refresh_missing(key, event, generation)
+    
+    def _refresh_missing(self, key: Tuple[bool, int], event: threading.Event,
+                         generation: int, background: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch for _get_all_missing, store the result and release waiters."""
+        try:
+            result = self._fetch_all_missing(*key)
+            with self._missing_lock:
+                if generation == self._missing_generation:
+                    if key[0]:
+                        # Item lists are large - keep only the most recent one
+                        for other in [k for k in self._missing_cache if k[0] and k != key]:
+                            self._missing_cache.pop(other, None)
+                    self._missing_cache[key] = (time.monotonic(), result)
+            return result
+        except Exception as e:
+            if not background:
+                raise
+            self.log.error("Background missing-items refresh failed: %s", e)
+            return None
+        finally:
+            with self._missing_lock:
+                self._missing_inflight.pop(key, None)
+            event.set()
+    
+    def _fetch_all_missing(self, include_items: bool, limit_per_instance: int) -> Dict[str, Any]:
+        """Uncached body of _get_all_missing."""
         items = []
         counts = {
             'sonarr_missing': 0,
@@ -1248,81 +1532,51 @@ class MachinarrCore:
             'cold': {'sonarr': 0, 'radarr': 0, 'total': 0},
         }
         
-        # Missing episodes
-        for name, client in self.sonarr_clients.items():
-            try:
-                missing = client.get_missing_episodes()
-                counts['sonarr_missing'] += len(missing)
-                self.log.info(f"Sonarr ({name}): Found {len(missing)} missing episodes")
-                
-                # Fast tier counting without full classification
-                for i, ep in enumerate(missing):
-                    # Quick tier determination from air date only
-                    tier = self.tier_manager.classify_from_date_str(
-                        ep.get('airDateUtc') or ep.get('airDate')
-                    )
-                    tier_counts[tier]['sonarr'] += 1
-                    tier_counts[tier]['total'] += 1
-                    
-                    # Only do full classification for display items
-                    if include_items and i < limit_per_instance:
-                        item = self.tier_manager.classify_episode(ep, {}, name)
-                        item.search_type = 'missing'
-                        items.append(item)
-            except Exception as e:
-                self.log.error(f"Sonarr ({name}) missing episodes error: {e}")
-        
-        # Upgrade episodes (cutoff unmet) - just count, no tier tracking
-        for name, client in self.sonarr_clients.items():
-            try:
-                upgrades = client.get_cutoff_unmet()
-                counts['sonarr_upgrade'] += len(upgrades)
-                self.log.info(f"Sonarr ({name}): Found {len(upgrades)} episodes needing upgrade")
-                
-                # Only classify display items
-                if include_items:
-                    for i, ep in enumerate(upgrades[:limit_per_instance]):
-                        item = self.tier_manager.classify_episode(ep, {}, name)
-                        item.search_type = 'upgrade'
-                        items.append(item)
-            except Exception as e:
-                self.log.error(f"Sonarr ({name}) cutoff unmet error: {e}")
+        # source -> (missing-list method, classifier, tier date, noun)
+        tm = self.tier_manager
+        kinds = {
+            'sonarr': ('get_missing_episodes', tm.classify_episodes, tm.episode_date_str, 'episodes'),
+            'radarr': ('get_missing_movies', tm.classify_movies, tm.movie_date_str, 'movies'),
+        }
         
-        # Missing movies
-        for name, client in self.radarr_clients.items():
+        # Fetch both lists from every instance concurrently (one pass per
+        # service, two requests per instance), then count and classify here
+        # on one thread (tier_counts/items aren't shared).
+        # Upgrades aren't tier-counted, so without display items only their
+        # totals are needed - ask for totalRecords instead of the full lists
+        jobs = []
+        for source, clients in self._arr_sources():
+            for name, client in clients.items():
+                jobs.append(((source, 'missing', name), getattr(client, kinds[source][0])))
+                jobs.append(((source, 'upgrade', name),
+                             client.get_cutoff_unmet if include_items else client.get_cutoff_unmet_count))
+        
+        for (source, search_type, name), records, error in self._fan_out(jobs):
             try:
-                missing = client.get_missing_movies()
-                counts['radarr_missing'] += len(missing)
-                self.log.info(f"Radarr ({name}): Found {len(missing)} missing movies")
+                if error:
+                    raise error
+                total = records if isinstance(records, int) else len(records)
+                counts[f'{source}_{search_type}'] += total
+                _, classify, date_str, noun = kinds[source]
                 
-                # Fast tier counting
-                for i, movie in enumerate(missing):
-                    # Quick tier from release dates
-                    tier = self.tier_manager.classify_movie_date(movie)
-                    tier_counts[tier]['radarr'] += 1
-                    tier_counts[tier]['total'] += 1
+                if search_type == 'missing':
+                    self.log.info("%s (%s): Found %s missing %s", source.capitalize(), name, total, noun)
                     
-                    if include_items and i < limit_per_instance:
-                        item = self.tier_manager.classify_movie(movie, name)
-                        item.search_type = 'missing'
-                        items.append(item)
-            except Exception as e:
-                self.log.error(f"Radarr ({name}) missing movies error: {e}")
-        
-        # Upgrade movies (cutoff unmet) - just count
-        for name, client in self.radarr_clients.items():
-            try:
-                upgrades = client.get_cutoff_unmet()
-                counts['radarr_upgrade'] += len(upgrades)
-                self.log.info(f"Radarr ({name}): Found {len(upgrades)} movies needing upgrade")
+                    # Fast tier counting from air/release dates (one batched pass)
+                    by_tier = tm.count_tiers(map(date_str, records))
+                    for tier, n in by_tier.items():
+                        tier_counts[tier][source] += n
+                        tier_counts[tier]['total'] += n
+                else:
+                    # Upgrades (cutoff unmet) - just count, no tier tracking
+                    self.log.info("%s (%s): Found %s %s needing upgrade", source.capitalize(), name, total, noun)
                 
+                # Only do full classification for display items
                 if include_items:
-                    for i, movie in enumerate(upgrades[:limit_per_instance]):
-                        item = self.tier_manager.classify_movie(movie, name)
-                        item.search_type = 'upgrade'
-                        items.append(item)
+                    items.extend(classify(records[:limit_per_instance], name, search_type))
             except Exception as e:
-                self.log.error(f"Radarr ({name}) cutoff unmet error: {e}")
+                what = f'missing {kinds[source][3]}' if search_type == 'missing' else 'cutoff unmet'
+                self.log.error("%s (%s) %s error: %s", source.capitalize(), name, what, e)
         
         return {
             'items': items,
@@ -1335,6 +1589,10 @@ class MachinarrCore:
     def get_missing_items(self) -> Dict[str, Any]:
         """Get missing items and upgrades organized by tier."""
         missing_data = self._get_all_missing(include_items=True)
+        # Same cached fetch as last time -> same response; skip regrouping
+        memo = self._missing_items_memo
+        if memo is not None and memo[0] is missing_data:
+            return memo[1]
         items = missing_data['items']
         
         by_tier = {'hot': [], 'warm': [], 'cool': [], 'cold': []}
@@ -1348,7 +1606,7 @@ class MachinarrCore:
             else:
                 upgrade_count += 1
         
-        return {
+        result = {
             'by_tier': by_tier,
             'total': len(items),
             'missing_count': missing_count,
@@ -1356,90 +1614,95 @@ class MachinarrCore:
             'true_counts': missing_data['counts'],
             'tier_counts': missing_data['tier_counts'],
         }
+        self._missing_items_memo = (missing_data, result)
+        return result
     
-    def get_queue_status(self) -> Dict[str, Any]:
-        """Get current queue status including active downloads."""
+    def get_overview(self) -> Dict[str, Any]:
+        """
+        Status, dashboard and queue data in one call.
+        
+        For clients that poll all three together: the queue monitor's stuck
+        items and interventions are read once and shared between the parts.
+        """
         stuck = self.queue_monitor.get_stuck_items()
+        interventions = self.queue_monitor.get_pending_interventions()
+        return {
+            'status': self.get_status(),
+            'dashboard': self.get_dashboard_data(stuck=stuck, interventions=interventions),
+            'queue': self.get_queue_status(stuck=stuck),
+        }
+    
+    def get_queue_status(self, stuck: Optional[List] = None) -> Dict[str, Any]:
+        """Get current queue status including active downloads."""
+        if stuck is None:
+            stuck = self.queue_monitor.get_stuck_items()
+        
+        # Fetch every instance's queue at once (each dashboard poll lands
+        # here), then process them in instance order
+        jobs = [((source, name), client.get_queue)
+                for source, clients in (*self._arr_sources(), ('sabnzbd', self.sabnzbd_clients))
+                for name, client in clients.items()]
         
         # Get active downloads from Sonarr/Radarr queues
         active_downloads = []
         downloading_ids = set()  # Track what's already downloading
+        # Get SABnzbd downloads if configured
+        sabnzbd_downloads = []
         
-        for name, client in self.sonarr_clients.items():
+        for (source, name), queue, error in self._fan_out(jobs):
+            label = 'SABnzbd' if source == 'sabnzbd' else source.capitalize()
+            if error:
+                self.log.error("Failed to get %s (%s) queue: %s", label, name, error)
+                continue
+            
             try:
-                queue = client.get_queue()
+                if source == 'sabnzbd':
+                    for item in queue:  # list of parsed items
+                        sabnzbd_downloads.append({
+                            'source': 'sabnzbd',
+                            'instance': name,
+                            'id': item.get('id', ''),
+                            'title': item.get('filename', 'Unknown'),
+                            'status': item.get('status', 'Downloading'),
+                            'progress': float(item.get('percentage', 0)),
+                            'size': item.get('size', '0'),
+                            'sizeleft': item.get('size_left', '0'),
+                            'timeleft': item.get('timeleft', ''),
+                        })
+                    continue
+                
                 for item in queue:
                     status = item.get('status', '').lower()
-                    if status in ('downloading', 'queued', 'paused'):
-                        size = item.get('size', 1) or 1
-                        sizeleft = item.get('sizeleft', 0) or 0
-                        download_info = {
-                            'source': 'sonarr',
-                            'instance': name,
-                            'queue_id': item.get('id'),
-                            'title': item.get('title', 'Unknown'),
-                            'status': status,
-                            'progress': (1 - sizeleft / size) * 100,
-                            'size': item.get('size', 0),
-                            'sizeleft': sizeleft,
-                            'timeleft': item.get('timeleft'),
-                            'series_id': item.get('seriesId'),
-                            'episode_id': item.get('episodeId'),
-                        }
-                        active_downloads.append(download_info)
+                    if status not in ('downloading', 'queued', 'paused'):
+                        continue
+                    size = item.get('size', 1) or 1
+                    sizeleft = item.get('sizeleft', 0) or 0
+                    download_info = {
+                        'source': source,
+                        'instance': name,
+                        'queue_id': item.get('id'),
+                        'title': item.get('title', 'Unknown'),
+                        'status': status,
+                        'progress': (1 - sizeleft / size) * 100,
+                        'size': item.get('size', 0),
+                        'sizeleft': sizeleft,
+                        'timeleft': item.get('timeleft'),
+                    }
+                    if source == 'sonarr':
+                        download_info['series_id'] = item.get('seriesId')
+                        download_info['episode_id'] = item.get('episodeId')
                         # Track by series/episode to avoid duplicate searches
                         if item.get('seriesId'):
                             downloading_ids.add(f"sonarr:{item.get('seriesId')}")
                         if item.get('episodeId'):
                             downloading_ids.add(f"sonarr:ep:{item.get('episodeId')}")
-            except Exception as e:
-                self.log.error(f"Failed to get Sonarr ({name}) queue: {e}")
-        
-        for name, client in self.radarr_clients.items():
-            try:
-                queue = client.get_queue()
-                for item in queue:
-                    status = item.get('status', '').lower()
-                    if status in ('downloading', 'queued', 'paused'):
-                        size = item.get('size', 1) or 1
-                        sizeleft = item.get('sizeleft', 0) or 0
-                        download_info = {
-                            'source': 'radarr',
-                            'instance': name,
-                            'queue_id': item.get('id'),
-                            'title': item.get('title', 'Unknown'),
-                            'status': status,
-                            'progress': (1 - sizeleft / size) * 100,
-                            'size': item.get('size', 0),
-                            'sizeleft': sizeleft,
-                            'timeleft': item.get('timeleft'),
-                            'movie_id': item.get('movieId'),
-                        }
-                        active_downloads.append(download_info)
+                    else:
+                        download_info['movie_id'] = item.get('movieId')
                         if item.get('movieId'):
                             downloading_ids.add(f"radarr:{item.get('movieId')}")
+                    active_downloads.append(download_info)
             except Exception as e:
-                self.log.error(f"Failed to get Radarr ({name}) queue: {e}")
-        
-        # Get SABnzbd downloads if configured
-        sabnzbd_downloads = []
-        for name, client in self.sabnzbd_clients.items():
-            try:
-                sab_queue = client.get_queue()  # Returns list of parsed items
-                for item in sab_queue:
-                    sabnzbd_downloads.append({
-                        'source': 'sabnzbd',
-                        'instance': name,
-                        'id': item.get('id', ''),
-                        'title': item.get('filename', 'Unknown'),
-                        'status': item.get('status', 'Downloading'),
-                        'progress': float(item.get('percentage', 0)),
-                        'size': item.get('size', '0'),
-                        'sizeleft': item.get('size_left', '0'),
-                        'timeleft': item.get('timeleft', ''),
-                    })
-            except Exception as e:
-                self.log.error(f"Failed to get SABnzbd ({name}) queue: {e}")
+                self.log.error("Failed to read %s (%s) queue: %s", label, name, e)
         
         return {
             'stuck_items': [s.to_dict() for s in stuck],
@@ -1459,8 +1722,15 @@ class MachinarrCore:
         # Search interventions (exhausted attempts and long-missing)
         search_interventions = self.searcher.get_intervention_items()
         
-        # Combine both types
-        all_items = [i.to_dict() for i in queue_interventions]
+        # Combine both types, each paired with its sort key (urgency rank,
+        # created_at) so the sort below is a plain tuple compare. Queue
+        # interventions carry no urgency and rank after the high ones.
+        keyed = []
+        for intervention in queue_interventions:
+            item = intervention.to_dict()
+            keyed.append(((1, item['created_at']), item))
+        urgent_count = 0
+        long_missing_count = 0
         
         # Add search interventions with consistent format
         for si in search_interventions:
@@ -1495,7 +1765,12 @@ class MachinarrCore:
                     'flagged_at': si['flagged_at'],
                 }
             
-            all_items.append({
+            if urgency == 'high':
+                urgent_count += 1
+            if intervention_type == 'long_missing':
+                long_missing_count += 1
+            
+            keyed.append(((0 if urgency == 'high' else 1, si['flagged_at'] or ''), {
                 'id': si['id'],
                 'title': si['title'],
                 'source': si['source'],
@@ -1506,16 +1781,17 @@ class MachinarrCore:
                 'details': details,
                 'available_actions': available_actions,
                 'created_at': si['flagged_at'],
-            })
+            }))
         
         # Sort by urgency (high first)
-        all_items.sort(key=lambda x: (0 if x.get('urgency') == 'high' else 1, x.get('created_at', '')))
+        keyed.sort(key=itemgetter(0))
+        all_items = [item for _, item in keyed]
         
         return {
             'items': all_items,
             'count': len(all_items),
-            'urgent_count': sum(1 for i in all_items if i.get('urgency') == 'high'),
-            'long_missing_count': sum(1 for i in all_items if i.get('intervention_type') == 'long_missing'),
+            'urgent_count': urgent_count,
+            'long_missing_count': long_missing_count,
         }
     
     def trigger_search(self, data: Dict) -> Dict[str, Any]:
@@ -1542,6 +1818,8 @@ class MachinarrCore:
                 progress_callback=on_progress,
                 abort_check=should_abort
             )
+            # Searched items now carry new search counts/times
+            self.invalidate_missing_cache()
             
             if result.get('aborted'):
                 self.set_activity('idle', 'Search stopped', 'Cancelled by user')
@@ -1558,12 +1836,14 @@ class MachinarrCore:
             return result
             
         elif search_type == 'single':
-            return self.searcher.search_single(
+            result = self.searcher.search_single(
                 data.get('source'),
                 data.get('id'),
                 self.sonarr_clients,
                 self.radarr_clients
             )
+            self.invalidate_missing_cache()
+            return result
         
         return {'success': False, 'message': 'Invalid search type'}
     
@@ -1573,60 +1853,109 @@ class MachinarrCore:
         queue_id = data.get('queue_id')
         action = data.get('action', 'blocklist_retry')
         
-        self.log.info(f"Resolving {source} queue item {queue_id} with action: {action}")
+        self.log.info("Resolving %s queue item %s with action: %s", source, queue_id, action)
         
         if not source or not queue_id:
-            self.log.error(f"Missing source or queue_id: source={source}, queue_id={queue_id}")
+            self.log.error("Missing source or queue_id: source=%s, queue_id=%s", source, queue_id)
             return {'success': False, 'message': 'Missing source or queue_id'}
         
-        if source == 'sonarr':
-            for name, client in self.sonarr_clients.items():
-                try:
-                    self.log.info(f"Trying to resolve via Sonarr instance: {name}")
-                    if action == 'blocklist_retry':
-                        success = client.delete_queue_item(queue_id, blocklist=True)
-                    elif action == 'remove':
-                        success = client.delete_queue_item(queue_id, blocklist=False)
-                    else:
-                        self.log.warning(f"Unknown action: {action}")
-                        continue
-                    
-                    if success:
-                        self.log.info(f"Successfully resolved {source} item {queue_id} via {name}")
-                        return {'success': True, 'message': f'Resolved via {name}'}
-                    else:
-                        self.log.warning(f"delete_queue_item returned False for {name}")
-                except Exception as e:
-                    self.log.error(f"Failed to resolve via {name}: {e}")
-                    continue
+        clients = self._arr_clients(source)
+        if clients is None:
+            self.log.error("Unknown source: %s", source)
+            return {'success': False, 'message': f'Unknown source: {source}'}
         
-        elif source == 'radarr':
-            for name, client in self.radarr_clients.items():
-                try:
-                    self.log.info(f"Trying to resolve via Radarr instance: {name}")
-                    if action == 'blocklist_retry':
-                        success = client.delete_queue_item(queue_id, blocklist=True)
-                    elif action == 'remove':
-                        success = client.delete_queue_item(queue_id, blocklist=False)
-                    else:
-                        self.log.warning(f"Unknown action: {action}")
-                        continue
-                    
-                    if success:
-                        self.log.info(f"Successfully resolved {source} item {queue_id} via {name}")
-                        return {'success': True, 'message': f'Resolved via {name}'}
-                    else:
-                        self.log.warning(f"delete_queue_item returned False for {name}")
-                except Exception as e:
-                    self.log.error(f"Failed to resolve via {name}: {e}")
-                    continue
+        if action not in ('blocklist_retry', 'remove'):
+            self.log.warning("Unknown action: %s", action)
+            return {'success': False, 'message': f'Unknown action: {action}'}
+        
+        # Queue ids are per-instance, so when the caller knows which instance
+        # owns the item go straight to it instead of trying every client
+        instance_name = data.get('instance_name')
+        if instance_name:
+            client = clients.get(instance_name)
+            if not client:
+                self.log.error("Unknown %s instance: %s", source, instance_name)
+                return {'success': False, 'message': f'Instance {instance_name} not found'}
+            candidates = [(instance_name, client)]
         else:
-            self.log.error(f"Unknown source: {source}")
-            return {'success': False, 'message': f'Unknown source: {source}'}
+            # Otherwise use the instance the last queue sweep saw it on
+            owner = self._queue_owner.get(source, {}).get(queue_id)
+            if owner in clients:
+                candidates = [(owner, clients[owner])]
+            else:
+                candidates = list(clients.items())
         
-        self.log.warning(f"Could not resolve {source} item {queue_id}")
+        for name, client in candidates:
+            try:
+                self.log.info("Trying to resolve via %s instance: %s", source.capitalize(), name)
+                success = client.delete_queue_item(queue_id, blocklist=(action == 'blocklist_retry'))
+                
+                if success:
+                    self.log.info("Successfully resolved %s item %s via %s", source, queue_id, name)
+                    self.invalidate_missing_cache()
+                    return {'success': True, 'message': f'Resolved via {name}'}
+                else:
+                    self.log.warning("delete_queue_item returned False for %s", name)
+            except Exception as e:
+                self.log.error("Failed to resolve via %s: %s", name, e)
+                continue
+        
+        self.log.warning("Could not resolve %s item %s", source, queue_id)
         return {'success': False, 'message': 'Could not resolve item - check logs for details'}
     
+    def resolve_items_bulk(self, items: List[Dict]) -> Dict[str, Any]:
+        """
+        Resolve several stuck items, one bulk request per instance and action.
+        
+        Each item takes the same fields as resolve_item. Items whose owning
+        instance isn't known (no instance_name and not seen by the last queue
+        sweep) fall back to resolve_item.
+        """
+        groups: Dict[Tuple[str, str, str], List[Any]] = defaultdict(list)
+        fallback = []
+        for data in items:
+            source = data.get('source')
+            queue_id = data.get('queue_id')
+            action = data.get('action', 'blocklist_retry')
+            clients = self._arr_clients(source)
+            if not clients or not queue_id or action not in ('blocklist_retry', 'remove'):
+                fallback.append(data)
+                continue
+            owner = data.get('instance_name') or self._queue_owner.get(source, {}).get(queue_id)
+            if owner in clients:
+                groups[(source, owner, action)].append(queue_id)
+            else:
+                fallback.append(data)
+        
+        resolved = failed = 0
+        for (source, name, action), queue_ids in groups.items():
+            client = self._arr_clients(source)[name]
+            try:
+                success = client.delete_queue_items_bulk(queue_ids, blocklist=(action == 'blocklist_retry'))
+            except Exception as e:
+                self.log.error("Bulk resolve failed via %s: %s", name, e)
+                success = False
+            if success:
+                self.log.info("Resolved %d %s item(s) via %s", len(queue_ids), source, name)
+                resolved += len(queue_ids)
+            else:
+                failed += len(queue_ids)
+        
+        for data in fallback:
+            if self.resolve_item(data).get('success'):
+                resolved += 1
+            else:
+                failed += 1
+        
+        if resolved:
+            self.invalidate_missing_cache()
+        return {
+            'success': failed == 0,
+            'resolved': resolved,
+            'failed': failed,
+            'message': f'Resolved {resolved} of {resolved + failed} items',
+        }
+    
     def handle_intervention(self, action: str, data: Dict) -> Dict[str, Any]:
         """Handle a manual intervention action."""
         if action == 'dismiss':
@@ -1645,7 +1974,6 @@ class MachinarrCore:
             
             key = f"{source}:{item_id}"
             if key in self.tier_manager.search_history:
-                from datetime import timedelta
                 # Set last_searched to future minus cooldown (effectively delays next search)
                 self.tier_manager.search_history[key].last_searched = datetime.utcnow()
                 self.tier_manager.search_history[key].search_count = 0  # Reset search count
@@ -1681,7 +2009,7 @@ class MachinarrCore:
             message = 'Could not unmonitor item'
             
             if source == 'sonarr':
-                for name, client in self.sonarr_clients.items():
+                for name, client in self._owner_candidates(source, data):
                     try:
                         if client.unmonitor_episode(item_id):
                             success = True
@@ -1692,7 +2020,7 @@ class MachinarrCore:
                         self.log.error(f"Failed to unmonitor via {name}: {e}")
             
             elif source == 'radarr':
-                for name, client in self.radarr_clients.items():
+                for name, client in self._owner_candidates(source, data):
                     try:
                         if client.unmonitor_movie(item_id):
                             success = True
@@ -1715,28 +2043,23 @@ class MachinarrCore:
             # Get URL to open item in Sonarr/Radarr
             source = data.get('source')
             item_id = data.get('id')
-            instance_name = data.get('instance_name')
             
             if source == 'sonarr':
-                for name, client in self.sonarr_clients.items():
-                    if instance_name and name != instance_name:
-                        continue
+                for name, client in self._owner_candidates(source, data):
                     base_url = client.get_base_url()
                     # Get episode to find series ID
                     try:
-                        episode = client.get_episode(item_id)
+                        episode = self._get_episode_cached(name, client, item_id)
                         if episode and 'seriesId' in episode:
                             series_id = episode['seriesId']
                             return {'success': True, 'url': f'{base_url}/series/{series_id}'}
-                    except:
-                        pass
+                    except APIError as e:
+                        self.log.debug("Could not look up Sonarr (%s) episode %s: %s", name, item_id, e)
                     # Fallback to activity queue
                     return {'success': True, 'url': f'{base_url}/activity/queue'}
             
             elif source == 'radarr':
-                for name, client in self.radarr_clients.items():
-                    if instance_name and name != instance_name:
-                        continue
+                for name, client in self._owner_candidates(source, data):
                     base_url = client.get_base_url()
                     return {'success': True, 'url': f'{base_url}/movie/{item_id}'}
             
@@ -1750,12 +2073,14 @@ class MachinarrCore:
             
             success = False
             message = 'Could not delete item'
+            deleted_via = None
             
             if source == 'radarr':
-                for name, client in self.radarr_clients.items():
+                for name, client in self._owner_candidates(source, data):
                     try:
                         if client.delete_movie(item_id, delete_files=delete_files, add_exclusion=True):
                             success = True
+                            deleted_via = name
                             message = f'Deleted from {name}' + (' (files removed)' if delete_files else ' (files kept)')
                             self.log.info(f"Deleted Radarr movie {item_id} via {name}")
                             break
@@ -1763,14 +2088,22 @@ class MachinarrCore:
                         self.log.error(f"Failed to delete via {name}: {e}")
             
             elif source == 'sonarr':
-                # For Sonarr episodes, we need to get the series ID first
-                for name, client in self.sonarr_clients.items():
+                # For Sonarr episodes, we need to get the series ID first. The
+                # lookups are read-only, so ask every instance at once; the
+                # delete itself still goes to the first one (in config order)
+                # that knows the episode
+                jobs = [((name, client), partial(self._get_episode_cached, name, client, item_id))
+                        for name, client in self._owner_candidates(source, data)]
+                for (name, client), episode, error in self._fan_out(jobs):
                     try:
-                        episode = client.get_episode(item_id)
+                        if error:
+                            raise error
                         if episode and 'seriesId' in episode:
                             series_id = episode['seriesId']
                             if client.delete_series(series_id, delete_files=delete_files, add_exclusion=True):
                                 success = True
+                                deleted_via = name
+                                self._episode_cache.pop((name, item_id), None)
                                 message = f'Deleted series from {name}' + (' (files removed)' if delete_files else ' (files kept)')
                                 self.log.info(f"Deleted Sonarr series {series_id} via {name}")
                                 break
@@ -1779,77 +2112,165 @@ class MachinarrCore:
             
             if success:
                 self.queue_monitor.dismiss_intervention(source, item_id, data.get('type'))
+                if delete_files:
+                    # Freed space - don't show the cached freeSpace for this
+                    # instance's root folders until the TTL runs out
+                    self._root_folder_cache.pop((source.capitalize(), deleted_via), None)
             
             return {'success': success, 'message': message}
         
         return {'success': False, 'message': 'Unknown action'}
     
+    def _owner_candidates(self, source: str, data: Dict) -> List[Tuple[str, Any]]:
+        """
+        Instances to try for an intervention action on one item.
+        
+        Item ids are per-instance, so when the owner is known - from the
+        caller's instance_name or the intervention that raised the item -
+        only that instance is tried; otherwise every instance, in order. An
+        instance_name that isn't configured matches nothing rather than
+        falling through to other instances.
+        """
+        clients = self._arr_clients(source) or {}
+        instance_name = data.get('instance_name')
+        if instance_name:
+            client = clients.get(instance_name)
+            return [(instance_name, client)] if client else []
+        owner = self.queue_monitor.get_intervention_instance(source, data.get('id'), data.get('type'))
+        if owner in clients:
+            return [(owner, clients[owner])]
+        return list(clients.items())
+    
+    def _get_episode_cached(self, name: str, client, episode_id) -> Dict:
+        """client.get_episode, reused for _episode_ttl seconds per instance."""
+        key = (name, episode_id)
+        cached = self._episode_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._episode_ttl:
+            return cached[1]
+        episode = client.get_episode(episode_id)
+        if len(self._episode_cache) >= 256:
+            self._episode_cache.clear()
+        self._episode_cache[key] = (time.monotonic(), episode)
+        return episode
+    
     def _grab_release(self, data: Dict) -> Dict[str, Any]:
         """Grab a release despite rejections."""
         source = data.get('source')
         guid = data.get('guid')
         indexer_id = data.get('indexer_id')
         
+        clients = self._arr_clients(source)
+        if clients is None:
+            return {'success': False, 'message': 'Could not grab release'}
+        
+        # Releases come from one instance's search results - grab through that
+        # instance when it's known (from the caller or the intervention that
+        # offered the release). With several instances and no owner, any
+        # pick could be the wrong *arr, so refuse rather than guess
+        instance_name = (data.get('instance_name')
+                         or self.queue_monitor.get_release_instance(source, guid))
+        if instance_name:
+            client = clients.get(instance_name)
+            if not client:
+                return {'success': False, 'message': f'Instance {instance_name} not found'}
+        elif len(clients) == 1:
+            client = next(iter(clients.values()))
+        else:
+            self.log.warning("Not grabbing %s release %s: owning instance unknown", source, guid)
+            return {'success': False,
+                    'message': 'Could not grab release - instance unknown' if clients else 'Could not grab release'}
+        
         try:
-            if source == 'sonarr':
-                for client in self.sonarr_clients.values():
-                    result = client.grab_release(guid, indexer_id)
-                    return {'success': True, 'message': 'Release grabbed'}
-            elif source == 'radarr':
-                for client in self.radarr_clients.values():
-                    result = client.grab_release(guid, indexer_id)
-                    return {'success': True, 'message': 'Release grabbed'}
+            client.grab_release(guid, indexer_id)
+            return {'success': True, 'message': 'Release grabbed'}
         except Exception as e:
             return {'success': False, 'message': str(e)}
-        
-        return {'success': False, 'message': 'Could not grab release'}
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get storage information."""
         paths = []
         warnings = []
         
-        # Get from Sonarr/Radarr root folders
-        for name, client in self.sonarr_clients.items():
-            try:
-                for folder in client.get_root_folders():
-                    free = folder.get('freeSpace', 0)
-                    path = folder.get('path', '')
-                    
-                    # Estimate total (not directly available)
-                    paths.append({
-                        'path': path,
-                        'free_gb': round(free / (1024**3), 1),
-                        'source': f'Sonarr ({name})'
-                    })
-            except:
-                pass
+        # Root folder lists change rarely - reuse them for _root_folder_ttl and
+        # only ask the services again for instances whose entry is stale
+        now = time.monotonic()
+        folders_by_instance = {}
+        jobs = []
+        for source, clients in self._arr_sources():
+            label = source.capitalize()
+            for name, client in clients.items():
+                key = (label, name)
+                cached = self._root_folder_cache.get(key)
+                if cached and now - cached[0] < self._root_folder_ttl:
+                    folders_by_instance[key] = cached[1]
+                else:
+                    folders_by_instance[key] = None
+                    jobs.append((key, client.get_root_folders))
         
-        for name, client in self.radarr_clients.items():
-            try:
-                for folder in client.get_root_folders():
+        for key, folders, error in self._fan_out(jobs):
+            if not error:
+                self._root_folder_cache[key] = (time.monotonic(), folders)
+                folders_by_instance[key] = folders
+        
+        try:
+            root_dev = os.stat('/').st_dev
+        except OSError:
+            root_dev = None
+        
+        # Instances often share root folders - stat each path only once
+        local_free: Dict[str, Optional[int]] = {}
+        warned = set()
+        for (label, name), folders in folders_by_instance.items():
+            source_label = f'{label} ({name})'
+            for folder in folders or []:
+                path = folder.get('path', '')
+                # Free space straight from the filesystem when the folder is
+                # mounted here too (fresh, no HTTP); otherwise what the service
+                # reported
+                if path not in local_free:
+                    local_free[path] = self._local_free_bytes(path, root_dev)
+                free = local_free[path]
+                if free is None:
                     free = folder.get('freeSpace', 0)
-                    path = folder.get('path', '')
-                    
-                    paths.append({
+                
+                free_gb = round(free / _GIB, 1)
+                
+                # Estimate total (not directly available)
+                paths.append({
+                    'path': path,
+                    'free_gb': free_gb,
+                    'source': source_label
+                })
+                
+                # Warn once per path, however many instances share it
+                if free_gb < 50 and path not in warned:
+                    warned.add(path)
+                    warnings.append({
                         'path': path,
-                        'free_gb': round(free / (1024**3), 1),
-                        'source': f'Radarr ({name})'
+                        'message': f"Low space: {free_gb} GB free",
+                        'level': 'critical' if free_gb < 20 else 'warning'
                     })
-            except:
-                pass
-        
-        # Check for warnings
-        for p in paths:
-            if p['free_gb'] < 50:
-                warnings.append({
-                    'path': p['path'],
-                    'message': f"Low space: {p['free_gb']} GB free",
-                    'level': 'critical' if p['free_gb'] < 20 else 'warning'
-                })
         
         return {'paths': paths, 'warnings': warnings}
     
+    @staticmethod
+    def _local_free_bytes(path: str, root_dev: Optional[int]) -> Optional[int]:
+        """
+        Free bytes for a Sonarr/Radarr root folder if it's mounted here too.
+        
+        Only trusted when the path lives on a different device than / - a
+        same-named directory in our own root filesystem says nothing about
+        the media volume. Returns None when the service's number should be used.
+        """
+        if not path or root_dev is None:
+            return None
+        try:
+            if os.stat(path).st_dev == root_dev:
+                return None
+            return shutil.disk_usage(path).free
+        except OSError:
+            return None
+    
     def get_recent_finds(self, limit: int = 50) -> Dict[str, Any]:
         """Get recent successful finds from FindTracker."""
         return {
@@ -1859,7 +2280,8 @@ class MachinarrCore:
     
     def record_find(self, title: str, source: str, instance: str, 
                     resolution_type: str, resolution_detail: str = "",
-                    item_id: int = 0, series_id: int = None, tier: str = 'unknown'):
+                    item_id: int = 0, series_id: int = None, tier: str = 'unknown',
+                    search_type: str = 'missing'):
         """Record a successful find with how it was resolved.
         
         This is the manual recording method - typically used for auto-resolution finds.
@@ -1873,27 +2295,41 @@ class MachinarrCore:
             item_id=item_id,
             series_id=series_id,
             tier=tier,
+            search_type=search_type,
             resolution_type=resolution_type,
-            resolution_detail=resolution_detail,
         )
         
-        # Also notify
+        # Also notify - the notifier does its own batching
         self.notifier.notify_find(title, source, tier)
-        self.log.info(f"🎉 Found: {title} ({resolution_type})")
+        self.log.info("🎉 Found: %s (%s%s)", title, resolution_type,
+                      f": {resolution_detail}" if resolution_detail else "")
+        self.invalidate_missing_cache()
     
     def _load_finds(self):
         """Load recent finds from disk."""
         try:
-            import json
             finds_path = self.config.data_dir / 'recent_finds.json'
             if finds_path.exists():
                 with open(finds_path, 'r') as f:
                     data = json.load(f)
-                self.recent_finds = data.get('finds', [])[-self.max_finds_history:]
+                for find in data.get('finds', []):
+                    self._append_recent_find(find)
                 self.log.info(f"Loaded {len(self.recent_finds)} recent finds from disk")
         except Exception as e:
             self.log.warning(f"Could not load recent finds: {e}")
     
+    def _append_recent_find(self, find: Dict):
+        """Append to recent_finds, keeping _finds_by_source in step (incl. eviction)."""
+        if len(self.recent_finds) == self.recent_finds.maxlen:
+            self._count_find_source(self.recent_finds[0], -1)
+        self.recent_finds.append(find)
+        self._count_find_source(find, 1)
+    
+    def _count_find_source(self, find: Dict, delta: int):
+        source = find.get('source', '').lower()
+        if source in self._finds_by_source:
+            self._finds_by_source[source] += delta
+    
     def _save_finds(self, force: bool = False):
         """Save recent finds to disk with debouncing."""
         if not hasattr(self, '_finds_pending_save'):
@@ -1914,12 +2350,11 @@ class MachinarrCore:
             return
         
         try:
-            import json
             finds_path = self.config.data_dir / 'recent_finds.json'
             finds_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(finds_path, 'w') as f:
-                json.dump({'finds': self.recent_finds}, f)
+                json.dump({'finds': list(self.recent_finds)}, f)
             
             self._finds_pending_save = 0
             self._finds_last_save = now
@@ -1952,10 +2387,19 @@ class MachinarrCore:
                 client = SABnzbdClient(url, api_key)
             else:
                 return {'success': False, 'message': 'Unknown service'}
-            
-            return client.test_connection()
         except Exception as e:
             return {'success': False, 'message': str(e)}
+        
+        # Run it off the request thread so an unreachable host can't hold
+        # the UI worker for the client's full library-sized timeout
+        client.timeout = CONNECTION_PROBE_TIMEOUT
+        [(_, result, error)] = self._fan_out([(service, client.test_connection)],
+                                             timeout=SERVICE_TEST_TIMEOUT, pool=self._probe_pool)
+        if isinstance(error, (TimeoutError, CancelledError)):
+            return {'success': False, 'message': f'Timed out after {SERVICE_TEST_TIMEOUT}s'}
+        if error:
+            return {'success': False, 'message': str(error)}
+        return result
     
     def test_email(self) -> Dict[str, Any]:
         """Test email configuration."""
@@ -1966,8 +2410,6 @@ class MachinarrCore:
         
         Server-side tracking ensures auto-search only triggers once across all devices.
         """
-        import json
-        from pathlib import Path
         
         version_file = Path('/config/version_state.json')
         
@@ -1977,7 +2419,7 @@ class MachinarrCore:
                     state = json.load(f)
             else:
                 state = {}
-        except:
+        except (OSError, ValueError):
             state = {}
         
         last_version = state.get('last_version')
@@ -2077,14 +2519,14 @@ class MachinarrCore:
             try:
                 queue = client.get_queue()
                 activity['queue_items'] += len(queue)
-            except:
+            except APIError:
                 pass
         
         for name, client in self.radarr_clients.items():
             try:
                 queue = client.get_queue()
                 activity['queue_items'] += len(queue)
-            except:
+            except APIError:
                 pass
         
         # Get stuck items count
@@ -2092,10 +2534,11 @@ class MachinarrCore:
         
         # Update global activity state if searches are in progress
         if activity['active_searches']:
-            with self._activity_lock:
-                self._activity_state['status'] = 'searching'
-                self._activity_state['message'] = f"{len(activity['active_searches'])} searches in progress"
-                self._activity_state['detail'] = ', '.join([s['type'] for s in activity['active_searches'][:3]])
+            self._update_activity(
+                status='searching',
+                message=f"{len(activity['active_searches'])} searches in progress",
+                detail=', '.join([s['type'] for s in activity['active_searches'][:3]]),
+            )
         
         self.log.info(f"Activity refresh: {len(activity['active_commands'])} active commands, {activity['queue_items']} queue items")
         
@@ -2108,17 +2551,14 @@ class MachinarrCore:
         """
         self._abort_requested = True
         
-        with self._activity_lock:
-            self._activity_state['status'] = 'idle'
-            self._activity_state['message'] = 'Stopped'
-            self._activity_state['detail'] = 'Operations cancelled by user'
-            self._activity_state['updated'] = datetime.now().isoformat()
+        self._update_activity(status='idle', message='Stopped',
+                              detail='Operations cancelled by user',
+                              updated=datetime.now().isoformat())
         
         self.log.info("Stop requested - aborting in-progress operations")
         
         # Reset abort flag after a short delay so new operations can start
         def reset_abort():
-            import time
             time.sleep(2)
             self._abort_requested = False
         
@@ -2244,7 +2684,6 @@ class MachinarrCore:
                     _log = self.log
                     
                     def delayed_search():
-                        import time
                         _log.info(f"Delayed search thread started for: {_title}")
                         time.sleep(5)  # Wait for Sonarr to fetch metadata
                         try:
@@ -2307,7 +2746,6 @@ class MachinarrCore:
                     _log = self.log
                     
                     def delayed_search():
-                        import time
                         _log.info(f"Delayed search thread started for: {_title}")
                         time.sleep(5)  # Wait for Radarr to fetch metadata
                         try:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Queue monitor tests - bulk resolution of stuck queue items.
+
+Usage:
+    python dev/tests/test_queue_monitor.py   (or run with pytest)
+
+Uses a fake *arr client that records the delete calls it receives, so no
+mock servers are needed.
+"""
+
+import logging
+import os
+import sys
+from datetime import datetime
+
+# Setup path for direct execution - the repo root holds automation/
+TFM_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, TFM_ROOT)
+
+from automation.queue_monitor import QueueMonitor, StuckItem
+
+
+class FakeLogger:
+    def get_logger(self, name):
+        return logging.getLogger(name)
+
+
+class FakeClient:
+    """Records queue deletes; bulk deletes fail when bulk_ok is False."""
+
+    def __init__(self, bulk_ok=True):
+        self.bulk_ok = bulk_ok
+        self.bulk_calls = []
+        self.single_calls = []
+
+    def delete_queue_items_bulk(self, queue_ids, blocklist=True,
+                                remove_from_client=True, skip_redownload=False):
+        self.bulk_calls.append((list(queue_ids), blocklist, skip_redownload))
+        return self.bulk_ok
+
+    def delete_queue_item(self, queue_id, blocklist=True,
+                          remove_from_client=True, skip_redownload=False):
+        self.single_calls.append((queue_id, blocklist, skip_redownload))
+        # Like the real clients, an id that's already gone (404) counts as deleted
+        return True
+
+
+def make_monitor(items):
+    monitor = QueueMonitor(config=None, logger=FakeLogger())
+    for stuck in items:
+        monitor.stuck_items[f"{stuck.source}:{stuck.queue_id}"] = stuck
+    return monitor
+
+
+def stuck(queue_id, action):
+    return StuckItem(
+        queue_id=queue_id, title=f"Test Item {queue_id}", source='sonarr',
+        instance_name='Main', status='warning', tracked_status='importBlocked',
+        issues=[], messages=[], first_detected=datetime.utcnow(),
+        can_auto_resolve=True, auto_resolve_action=action,
+    )
+
+
+def test_bulk_groups_by_action():
+    """One bulk call per action; single items use the per-item delete."""
+    items = [stuck(1, 'blocklist_retry'), stuck(2, 'blocklist_retry'),
+             stuck(3, 'remove'), stuck(4, None)]
+    monitor = make_monitor(items)
+    client = FakeClient()
+
+    resolved = monitor.resolve_stuck_items(items, client)
+
+    assert resolved == 3
+    assert client.bulk_calls == [([1, 2], True, False)]
+    assert client.single_calls == [(3, False, True)]
+    assert list(monitor.stuck_items) == ['sonarr:4']
+    assert monitor.resolved_count == 3
+
+
+def test_bulk_failure_falls_back_to_single_deletes():
+    """A failed bulk delete retries each item alone instead of leaving them all stuck."""
+    items = [stuck(1, 'remove'), stuck(2, 'remove'), stuck(3, 'remove')]
+    monitor = make_monitor(items)
+    client = FakeClient(bulk_ok=False)
+
+    resolved = monitor.resolve_stuck_items(items, client)
+
+    assert resolved == 3
+    assert len(client.bulk_calls) == 1
+    assert [call[0] for call in client.single_calls] == [1, 2, 3]
+    assert monitor.stuck_items == {}
+    assert monitor.resolved_count == 3
+
+
+def run_all_tests():
+    """Run all tests."""
+    tests = [test_bulk_groups_by_action, test_bulk_failure_falls_back_to_single_deletes]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n  Total: {len(tests) - failed}/{len(tests)} passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
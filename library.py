@@ -467,7 +467,7 @@ class LibraryManager:
                 missing = client.get_missing(page=1, page_size=1)
                 counts['sonarr_missing'] += missing.get('totalRecords', 0)
             except Exception as e:
-                self.log.debug(f"Could not get counts from {name}: {e}")
+                self.log.debug("Could not get counts from %s: %s", name, e)
         
         # Get Radarr counts
         for name, client in radarr_clients.items():
@@ -478,7 +478,7 @@ class LibraryManager:
                 missing = client.get_missing(page=1, page_size=1)
                 counts['radarr_missing'] += missing.get('totalRecords', 0)
             except Exception as e:
-                self.log.debug(f"Could not get counts from {name}: {e}")
+                self.log.debug("Could not get counts from %s: %s", name, e)
         
         return counts
     
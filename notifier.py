@@ -7,7 +7,7 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 import threading
 
@@ -78,6 +78,13 @@ class EmailNotifier:
                 tier=tier,
             ))
     
+    def notify_finds(self, finds: Iterable[Tuple[str, str, str]]):
+        """Add several (title, source, tier) finds to the batch queue at once."""
+        notifications = [FindNotification(title=title, source=source, tier=tier)
+                         for title, source, tier in finds]
+        with self._lock:
+            self.pending_finds.extend(notifications)
+    
     def flush_finds(self, force: bool = False) -> bool:
         """Send batched find notifications if due."""
         email_cfg = self.config.email
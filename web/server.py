@@ -4,6 +4,7 @@ Single-page dashboard with API endpoints.
 """
 
 from pathlib import Path
+from dataclasses import replace
 from flask import Flask, render_template, jsonify, request, redirect, url_for
 from typing import Dict, Any
 
@@ -113,6 +114,11 @@ class WebServer:
         def api_dashboard():
             return jsonify(self.core.get_dashboard_data())
         
+        @self.app.route('/api/overview')
+        def api_overview():
+            """Status, dashboard and queue in one response."""
+            return jsonify(self.core.get_overview())
+        
         @self.app.route('/api/missing')
         def api_missing():
             return jsonify(self.core.get_missing_items())
@@ -136,6 +142,16 @@ class WebServer:
             data = request.get_json() or {}
             return jsonify(self.core.resolve_item(data))
         
+        @self.app.route('/api/resolve/bulk', methods=['POST'])
+        def api_resolve_bulk():
+            data = request.get_json() or {}
+            return jsonify(self.core.resolve_items_bulk(data.get('items', [])))
+        
+        @self.app.route('/api/webhook/<source>', methods=['POST'])
+        def api_webhook(source):
+            data = request.get_json(silent=True) or {}
+            return jsonify(self.core.handle_webhook(source, data))
+        
         @self.app.route('/api/intervention/<action>', methods=['POST'])
         def api_intervention_action(action):
             data = request.get_json() or {}
@@ -233,26 +249,32 @@ class WebServer:
         def api_save_settings():
             data = request.get_json() or {}
             try:
-                # Update search config
-                if 'search' in data:
-                    for key, value in data['search'].items():
-                        if hasattr(self.config.search, key):
-                            setattr(self.config.search, key, value)
+                # Build every updated section first (replace() re-runs the
+                # dataclass validation), so a bad value is rejected before
+                # anything is applied or saved
+                sections = {}
+                for section in ('search', 'quiet_hours'):
+                    if section in data:
+                        current = getattr(self.config, section)
+                        changes = {k: v for k, v in data[section].items() if hasattr(current, k)}
+                        sections[section] = replace(current, **changes)
                 
-                # Update tier config
+                tiers = {}
                 if 'tiers' in data:
                     for tier_name, tier_data in data['tiers'].items():
                         if hasattr(self.config.tiers, tier_name):
+                            # TierSettings is immutable - swap in an updated copy
                             tier = getattr(self.config.tiers, tier_name)
-                            for key, value in tier_data.items():
-                                if hasattr(tier, key):
-                                    setattr(tier, key, value)
-                
-                # Update quiet hours config
-                if 'quiet_hours' in data:
-                    for key, value in data['quiet_hours'].items():
-                        if hasattr(self.config.quiet_hours, key):
-                            setattr(self.config.quiet_hours, key, value)
+                            changes = {k: v for k, v in tier_data.items() if hasattr(tier, k)}
+                            tiers[tier_name] = replace(tier, **changes)
+            except (TypeError, ValueError) as e:
+                return jsonify({'success': False, 'message': str(e)})
+            
+            try:
+                for section, value in sections.items():
+                    setattr(self.config, section, value)
+                for tier_name, tier in tiers.items():
+                    setattr(self.config.tiers, tier_name, tier)
                 
                 self.config.save()
                 return jsonify({'success': True})